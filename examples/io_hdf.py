@@ -17,8 +17,8 @@ def number_range(start: float = 1, length: int = 3):
 if __name__ == "__main__":
     # write result to file
     result = run_function_with_cmd_args(number_range)
-    result.to_file("test.hdf")
+    result.to_file("test.hdf", compression="lzf")
 
     # write result from file
-    read = Result.from_file("test.hdf")
+    read = Result.from_file("test.hdf", rdcc_nbytes=64 * 1024**2)
     print(read.parameters, "–– start + [0..length-1] =", read.result)
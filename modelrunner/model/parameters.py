@@ -17,7 +17,9 @@ One aim is to allow easy management of inheritance of parameters.
 from __future__ import annotations
 
 import copy
+import functools
 import logging
+import re
 import warnings
 from dataclasses import dataclass, field
 from typing import Any, Callable, Container, Dict, Iterator, List, Optional, Union
@@ -40,8 +42,33 @@ class NoValueType:
 NoValue = NoValueType()
 
 
+_INT_RE = re.compile(r"[+-]?\d+")
+"""regex matching strings that represent integers"""
+_FLOAT_RE = re.compile(r"[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?")
+"""regex matching strings that represent floating point numbers"""
+_SPECIAL_FLOATS = {"inf", "infinity", "nan"}
+"""set: strings without digits that can still be converted to floats"""
+
+
 def auto_type(value):
     """Convert value to float or int if reasonable."""
+    # handle common cases directly to avoid raising exceptions below
+    if type(value) is int:
+        return value
+    elif type(value) is float:
+        return int(value) if value.is_integer() else value
+    elif isinstance(value, str):
+        if _INT_RE.fullmatch(value):
+            return int(value)
+        elif _FLOAT_RE.fullmatch(value):
+            return float(value)
+        elif (
+            not any(c.isdigit() for c in value)
+            and value.strip().lstrip("+-").lower() not in _SPECIAL_FLOATS
+        ):
+            return value  # string cannot represent a number
+
+    # general conversion, e.g., for numpy types or strings with unusual formatting
     try:
         float_val = float(value)
     except (TypeError, ValueError):
@@ -58,6 +85,16 @@ def auto_type(value):
         return float_val
 
 
+@functools.lru_cache(maxsize=None)
+def _get_class_path(cls: type | Callable) -> str:
+    """Return the full import path of a class, which is cached for efficiency."""
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+_BUILTIN_TYPES = {int, float, str, bool, tuple, list}
+"""set: types for which values of the same type do not need to be converted"""
+
+
 @dataclass
 class Parameter:
     """Class representing a single parameter.
@@ -102,8 +139,14 @@ class Parameter:
 
     def __post_init__(self):
         """Check default values and cls."""
-        if self.cls is not object and not any(
-            self.default_value is v for v in {None, NoValue}
+        if self.cls in _BUILTIN_TYPES and isinstance(self.default_value, self.cls):
+            # the default value already has the correct type, so conversion is moot
+            self._check_value(self.default_value)
+
+        elif (
+            self.cls is not object
+            and self.default_value is not None
+            and self.default_value is not NoValue
         ):
             # check whether the default value is of the correct type
             try:
@@ -118,18 +161,21 @@ class Parameter:
 
             if isinstance(converted_value, np.ndarray):
                 # numpy arrays are checked for each individual value
-                valid_default = np.allclose(
-                    converted_value, self.default_value, equal_nan=True
-                )
+                valid_default = converted_value.shape == np.shape(
+                    self.default_value
+                ) and np.allclose(converted_value, self.default_value, equal_nan=True)
 
             else:
                 # other values are compared directly. Note that we also check identity
                 # to capture the case where the value is `math.nan`, where the direct
-                # comparison (nan == nan) would evaluate to False
-                valid_default = (
-                    converted_value is self.default_value
-                    or converted_value == self.default_value
-                )
+                # comparison (nan == nan) would evaluate to False. Array defaults are
+                # compared as a whole, since `==` would compare them element-wise
+                if converted_value is self.default_value:
+                    valid_default = True
+                elif isinstance(self.default_value, np.ndarray):
+                    valid_default = np.array_equal(converted_value, self.default_value)
+                else:
+                    valid_default = converted_value == self.default_value
 
             if not valid_default:
                 _logger.warning(
@@ -143,7 +189,7 @@ class Parameter:
         return {
             "name": str(self.name),
             "default_value": self.convert(),
-            "cls": self.cls.__module__ + "." + self.cls.__name__,
+            "cls": _get_class_path(self.cls),
             "description": self.description,
             "choices": self.choices,
             "required": self.required,
@@ -288,10 +334,12 @@ class Parameterized:
 
     parameters_default: ParameterListType = []
     """list: parameters (with default values) of this subclass"""
-    _parameters_default_full: ParameterListType = []
+    _parameters_default_full: list[Parameter] = []
     """list: all parameters (including those of parent classes)"""
     _subclasses: dict[str, type[Parameterized]] = {}
     """dict: a dictionary of all classes inheriting from `Parameterized`"""
+    _parameters_cache: dict[tuple[bool, bool, bool], dict[str, Parameter]]
+    """dict: cached results of :meth:`get_parameters` for this particular class"""
 
     def __init__(self, parameters: ParameterInputType = None, *, strict: bool = True):
         """Initialize the parameters of the object.
@@ -378,22 +426,21 @@ class Parameterized:
             include_deprecated (bool):
                 Include deprecated parameters
             sort (bool):
-                Return ordered dictionary with sorted keys
+                Return dictionary with sorted keys
 
         Returns:
             dict: a dictionary mapping names to instances of :class:`Parameter`
         """
-        # collect the parameters from the class hierarchy
-        parameters: dict[str, Parameter] = {}
-        for p in cls._parameters_default_full:
-            if isinstance(p, HideParameter):
-                if include_hidden:
-                    parameters[p.name].hidden = True
-                else:
-                    del parameters[p.name]
-
-            else:
-                parameters[p.name] = p
+        # look up the cache of this class. We use `__dict__` directly, so subclasses do
+        # not inherit the cache of their parent class
+        key = (include_hidden, include_deprecated, sort)
+        cache: dict[tuple[bool, bool, bool], dict[str, Parameter]] | None = (
+            cls.__dict__.get("_parameters_cache")
+        )
+        if cache is None:
+            cache = cls._parameters_cache = {}
+        elif key in cache:
+            return cache[key].copy()
 
         # filter parameters based on hidden and deprecated flags
         def show(p):
@@ -404,14 +451,14 @@ class Parameterized:
             show2 = include_deprecated or not isinstance(p, DeprecatedParameter)
             return show1 and show2
 
-        # filter parameters based on `show`
-        result = {
-            name: parameter for name, parameter in parameters.items() if show(parameter)
-        }
-
+        # filter the parameters of the class hierarchy, which have already been
+        # combined in `__init_subclass__`, including the effect of `HideParameter`
+        params = cls._parameters_default_full
         if sort:
-            result = dict(sorted(result.items()))
-        return result
+            params = sorted(params, key=lambda p: p.name)
+        result = {p.name: p for p in params if show(p)}
+        cache[key] = result
+        return result.copy()
 
     @classmethod
     def _parse_parameters(
@@ -441,8 +488,6 @@ class Parameterized:
         """
         if parameters is None:
             parameters = {}
-        else:
-            parameters = parameters.copy()  # do not modify the original
 
         # obtain all possible parameters
         param_objs = cls.get_parameters(
@@ -457,18 +502,20 @@ class Parameterized:
             if param_obj.required and name not in parameters:
                 raise ValueError(f"Require parameter `{name}`")
             # take value from parameters or set default value
-            value = parameters.pop(name, NoValue)
+            value = parameters.get(name, NoValue)
             # convert parameter to correct type
             result[name] = param_obj.convert(value, strict=check_validity)
 
-        # update parameters with the supplied ones
-        if check_validity and parameters:
+        # determine supplied parameters that have not been used so far
+        extras = [name for name in parameters if name not in result]
+        if check_validity and extras:
             raise ValueError(
-                f"Parameters `{sorted(parameters.keys())}` were provided for an "
+                f"Parameters `{sorted(extras)}` were provided for an "
                 f"instance but are not defined for the class `{cls.__name__}`"
             )
         else:
-            result.update(parameters)  # add remaining parameters
+            for name in extras:  # add remaining parameters
+                result[name] = parameters[name]
 
         return result
 
@@ -549,9 +596,9 @@ class Parameterized:
 
             # print the data to stdout
             if param.cls is object:
-                yield template_object.format(**data)
+                yield template_object.format_map(data)
             else:
-                yield template.format(**data)
+                yield template.format_map(data)
 
     @hybridmethod
     def show_parameters(
@@ -575,13 +622,16 @@ class Parameterized:
 
         All flags default to `False`.
         """
-        for line in cls._get_parameters_str(
-            description=description,
-            sort=sort,
-            show_hidden=show_hidden,
-            show_deprecated=show_deprecated,
-        ):
-            print(line)
+        lines = list(
+            cls._get_parameters_str(
+                description=description,
+                sort=sort,
+                show_hidden=show_hidden,
+                show_deprecated=show_deprecated,
+            )
+        )
+        if lines:
+            print("\n".join(lines))  # write all lines at once
 
     @show_parameters.instancemethod  # type: ignore
     def show_parameters(
@@ -609,14 +659,17 @@ class Parameterized:
 
         All flags default to `False`.
         """
-        for line in self._get_parameters_str(
-            description=description,
-            sort=sort,
-            show_hidden=show_hidden,
-            show_deprecated=show_deprecated,
-            parameter_values=None if default_value else self.parameters,
-        ):
-            print(line)
+        lines = list(
+            self._get_parameters_str(
+                description=description,
+                sort=sort,
+                show_hidden=show_hidden,
+                show_deprecated=show_deprecated,
+                parameter_values=None if default_value else self.parameters,
+            )
+        )
+        if lines:
+            print("\n".join(lines))  # write all lines at once
 
 
 def get_all_parameters(data: str = "name") -> dict[str, Any]:
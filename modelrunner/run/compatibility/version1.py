@@ -48,6 +48,26 @@ class StateBase:
     _state_classes: dict[str, type[StateBase]] = {}
     """dict: class-level list of all subclasses of StateBase"""
 
+    def __init_subclass__(cls, **kwargs):
+        """Register all subclasses to reconstruct them later."""
+        super().__init_subclass__(**kwargs)
+        cls._state_classes[cls.__name__] = cls
+
+    @classmethod
+    def _get_state_class(cls, cls_name: str) -> type[StateBase]:
+        """Return the state class with a given name.
+
+        Args:
+            cls_name (str): The name of the class
+
+        Returns:
+            The registered subclass of StateBase
+        """
+        try:
+            return cls._state_classes[cls_name]
+        except KeyError:
+            raise TypeError(f"Do not know how to load `{cls_name}`") from None
+
     def _state_init(self, attributes: dict[str, Any], data=NoData) -> None:
         """Initialize the state with attributes and (optionally) data.
 
@@ -71,13 +91,13 @@ class StateBase:
         Returns:
             The object containing the given attributes and data
         """
-        # copy attributes since they are modified in this function
-        attributes = attributes.copy()
         cls_name = attributes["__class__"]
         if cls_name != cls.__name__:
             raise RuntimeError(f"Expected `{cls.__name__}` but data had `{cls_name}`")
 
-        format_version = attributes.pop("__version__", 0)
+        # separate the version information without modifying the supplied dictionary
+        format_version = attributes.get("__version__", 0)
+        attributes = {k: v for k, v in attributes.items() if k != "__version__"}
         if format_version != 1:
             warnings.warn(f"File format version mismatch ({format_version} != 1)")
 
@@ -94,64 +114,50 @@ class StateBase:
         Args:
             content: The loaded data
         """
-        cls_name = content["attributes"]["__class__"]
-        if cls_name == "ArrayState":
-            return ArrayState.from_data(content["attributes"], content["data"])
-
-        elif cls_name == "ArrayCollectionState":
-            col_data = tuple(
-                np.array(content["data"][label])
-                for label in content["attributes"]["labels"]
+        attributes = content["attributes"]
+        state_cls = cls._get_state_class(attributes["__class__"])
+        if state_cls is ArrayCollectionState:
+            data: Any = tuple(
+                np.array(content["data"][label]) for label in attributes["labels"]
             )
-            return ArrayCollectionState.from_data(content["attributes"], col_data)
-
-        elif cls_name == "DictState":
-            dict_data: dict[str, StateBase] = {}
-            for label, substate in content["data"].items():
-                dict_data[label] = cls._from_simple_objects(substate)
 
-            return DictState.from_data(content["attributes"], dict_data)
-
-        elif cls_name == "ObjectState":
-            return ObjectState.from_data(content["attributes"], content["data"])
+        elif state_cls is DictState:
+            data = {
+                label: cls._from_simple_objects(substate)
+                for label, substate in content["data"].items()
+            }
 
         else:
-            raise TypeError(f"Do not know how to load `{cls_name}`")
+            data = content["data"]
+
+        return state_cls.from_data(attributes, data)
 
     @classmethod
     def _from_zarr(cls, zarr_element: zarrElement, *, index=...) -> StateBase:
         """Create instance of correct subclass from data stored in zarr."""
         # determine the class that knows how to read this data
-        cls_name = zarr_element.attrs["__class__"]
         attributes = zarr_element.attrs.asdict()
+        state_cls = cls._get_state_class(attributes["__class__"])
 
         # create object form zarr data
-        if cls_name == "ArrayState":
-            data = zarr_element[index]
-            return ArrayState.from_data(attributes, data)
-
-        elif cls_name == "ArrayCollectionState":
-            data = data = tuple(
-                zarr_element[label][index] for label in zarr_element.attrs["labels"]
+        if state_cls is ArrayCollectionState:
+            data: Any = tuple(
+                zarr_element[label][index] for label in attributes["labels"]
             )
-            return ArrayCollectionState.from_data(attributes, data)
 
-        elif cls_name == "DictState":
+        elif state_cls is DictState:
             data = {
                 label: cls._from_zarr(zarr_element[label], index=index)
-                for label in zarr_element.attrs["__keys__"]
+                for label in attributes["__keys__"]
             }
-            return DictState.from_data(attributes, data)
 
-        elif cls_name == "ObjectState":
-            if zarr_element.shape == () and index is ...:
-                data = zarr_element[index].item()
-            else:
-                data = zarr_element[index]
-            return ObjectState.from_data(attributes, data)
+        elif state_cls is ObjectState and zarr_element.shape == () and index is ...:
+            data = zarr_element[index].item()
 
         else:
-            raise TypeError(f"Do not know how to load `{cls_name}`")
+            data = zarr_element[index]
+
+        return state_cls.from_data(attributes, data)
 
 
 class ArrayState(StateBase): ...
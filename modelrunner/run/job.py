@@ -5,23 +5,32 @@
 
 from __future__ import annotations
 
-import errno
+import functools
 import itertools
 import json
 import logging
-import os
 import shlex
+import stat
 import subprocess as sp
 import sys
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Iterable, Literal
-
-from tqdm.auto import tqdm
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
 
 from .. import Parameter
 from ..config import Config
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+_logger = logging.getLogger("modelrunner.submit_job")
+
+# encoder for job parameters, which are plain data and thus cannot contain circular
+# references, so the costly bookkeeping to detect them can be skipped. The output is
+# identical to `json.dumps`, including the encoding of non-finite numbers like NaN.
+_encode_json = json.JSONEncoder(check_circular=False).encode
+
 
 def escape_string(obj) -> str:
     """Escape a string for the command line."""
@@ -30,13 +39,8 @@ def escape_string(obj) -> str:
 
 def ensure_directory_exists(folder: str | Path) -> None:
     """Creates a folder if it not already exists."""
-    if folder == "":
-        return
-    try:
-        Path(folder).mkdir(parents=True)
-    except OSError as err:
-        if err.errno != errno.EEXIST:
-            raise
+    if folder:
+        Path(folder).mkdir(parents=True, exist_ok=True)
 
 
 DEFAULT_CONFIG = [
@@ -107,14 +111,60 @@ def get_job_name(base: str, args: dict[str, Any] | None = None, length: int = 7)
     if args is None:
         args = {}
 
-    res = base[:-1] if base.endswith("_") else base
-    for name, value in args.items():
-        if hasattr(value, "__iter__"):
-            value_str = "_".join(f"{v:g}" for v in value)
-        else:
-            value_str = f"{value:g}"
-        res += f"_{name.replace('_', '')[:length].upper()}_{value_str}"
-    return res
+    stem = base[:-1] if base.endswith("_") else base
+    return stem + "".join(
+        _get_job_name_part(name, value, length) for name, value in args.items()
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _abbreviate_name(name: str, length: int) -> str:
+    """Abbreviate a parameter name for use in job names."""
+    return name.replace("_", "")[:length].upper()
+
+
+def _get_job_name_part(name: str, value, length: int = 7) -> str:
+    """Create the part of a job name that represents a single parameter.
+
+    Args:
+        name (str):
+            The name of the parameter
+        value:
+            The value of the parameter
+        length (int):
+            Length of the abbreviated parameter name
+
+    Returns:
+        str: The part of the job name, starting with an underscore
+    """
+    if isinstance(value, str):
+        value_str = value
+    elif hasattr(value, "__iter__"):
+        value_str = "_".join(f"{v:g}" for v in value)
+    else:
+        value_str = f"{value:g}"
+    return f"_{_abbreviate_name(name, length)}_{value_str}"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(path: str, mtime: int) -> Template:
+    """Load and compile a Jinja template, caching the result.
+
+    Args:
+        path (str):
+            The resolved path to the template file
+        mtime (int):
+            The modification time of the file, which is only used to invalidate the
+            cache when the template file changes
+
+    Returns:
+        :class:`jinja2.Template`: The compiled template
+    """
+    from jinja2 import Template
+
+    with Path(path).open() as fp:
+        template: Template = Template(fp.read())
+    return template
 
 
 OverwriteStrategyType = Literal[
@@ -122,64 +172,74 @@ OverwriteStrategyType = Literal[
 ]
 
 
-def submit_job(
-    script: str | Path,
-    output: str | Path | None = None,
-    name: str = "job",
-    parameters: str | dict[str, Any] | None = None,
-    config: str | dict[str, Any] | None = None,
-    *,
-    log_folder: str | Path | None = None,
-    method: str = "auto",
-    use_modelrunner: bool = True,
-    template: str | Path | None = None,
-    overwrite_strategy: OverwriteStrategyType = "error",
-    **kwargs,
-) -> tuple[str, str]:
-    """Submit a script to the cluster queue.
+def _overwrite_error(output: Path) -> bool:
+    raise RuntimeError(f"Output file `{output}` already exists")
+
+
+def _overwrite_warn_skip(output: Path) -> bool:
+    warnings.warn(f"Output file `{output}` already exists")
+    return True
+
+
+def _overwrite_silent_skip(output: Path) -> bool:
+    return True
+
+
+def _overwrite_warn(output: Path) -> bool:
+    warnings.warn(f"Output file `{output}` will be overwritten")
+    output.unlink()
+    return False
+
+
+def _overwrite_silent(output: Path) -> bool:
+    output.unlink()
+    return False
+
+
+# handlers deciding what to do with an existing output file. They return whether the
+# job should be skipped and delete the file if it is supposed to be overwritten
+_OVERWRITE_HANDLERS: dict[str, Callable[[Path], bool]] = {
+    "error": _overwrite_error,
+    "warn_skip": _overwrite_warn_skip,
+    "silent_skip": _overwrite_silent_skip,
+    "overwrite": _overwrite_warn,
+    "silent_overwrite": _overwrite_silent,
+}
+
+
+def _get_overwrite_handler(
+    overwrite_strategy: OverwriteStrategyType,
+) -> Callable[[Path], bool]:
+    """Return the handler implementing a strategy for existing output files.
 
     Args:
-        script (str of :class:`~pathlib.Path`):
-            Path to the script file, which contains the model
-        output (str of :class:`~pathlib.Path`):
-            Path to the output file, where all the results are saved
-        name (str):
-            Name of the job
-        parameters (str or dict):
-            Parameters for the script, either as a python dictionary or a string
-            containing a JSON-encoded dictionary.
-        config (str or dict):
-            Configuration for the job, which determines how the job is run. Can be either
-            a python dictionary or a string containing a JSON-encoded dictionary.
-        log_folder (str of :class:`~pathlib.Path`):
-            Path to the logging folder. If omitted, the default of the template is used,
-            which typically sends data to stdout for local scripts (which is thus
-            captured and returned by this function) or writes log files to the current
-            working directory for remote jobs.
-        method (str):
-            Specifies the submission method. Currently `background`, `foreground`,
-            'srun', and `qsub` are supported. The special value `auto` reads the method
-            from the `config` argument.
-        use_modelrunner (bool):
-            If True, `script` is envoked with the modelrunner library, e.g. by calling
-            `python -m modelrunner {script}`.
-        template (str of :class:`~pathlib.Path`):
-            Jinja template file for submission script. If omitted, a standard template
-            is chosen based on the submission method.
         overwrite_strategy (str):
-            Determines what to do when files already exist. Possible options include
-            `error`, `warn_skip`, `silent_skip`, `overwrite`, and `silent_overwrite`.
+            The strategy, which must be one of the keys of `_OVERWRITE_HANDLERS`
 
     Returns:
-        tuple: The result `(stdout, stderr)` of the submission call. These two strings
-            can contain the output from the actual scripts that is run when `log_folder`
-            is `None`.
+        callable: A function taking the path of the output and returning whether the
+        job should be skipped
     """
-    from jinja2 import Template
+    try:
+        return _OVERWRITE_HANDLERS[overwrite_strategy]
+    except KeyError:
+        raise NotImplementedError(f"Unknown strategy `{overwrite_strategy}`") from None
 
-    logger = logging.getLogger("modelrunner.submit_job")
 
-    # prepare job configuration
+def _get_configuration(
+    config: str | dict[str, Any] | None, kwargs: dict[str, Any]
+) -> Config:
+    """Determine the job configuration.
+
+    Args:
+        config (str or dict):
+            Configuration for the job, which is passed to :func:`get_config`
+        kwargs (dict):
+            Deprecated way of setting configuration values
+
+    Returns:
+        :class:`~modelrunner.config.Config`: the established configuration
+    """
     configuration = get_config(config)
     if kwargs:
         # deprecated since 2024-01-03
@@ -188,84 +248,60 @@ def submit_job(
             configuration[k] = v
     if configuration["python_bin"] == "sys.executable":
         configuration["python_bin"] = sys.executable
+    return configuration
 
-    # determine the submission method
-    if method == "auto":
-        method = configuration["method"]
 
-    # load the correct template
+def _get_template_path(method: str, template: str | Path | None = None) -> Path:
+    """Determine the path to the template of the submission script.
+
+    Args:
+        method (str):
+            The submission method, which determines the default template
+        template (str of :class:`~pathlib.Path`):
+            Jinja template file for submission script. If omitted, a standard template
+            is chosen based on the submission method.
+
+    Returns:
+        :class:`~pathlib.Path`: The resolved path to the template file
+    """
     if template is None:
         template_path = Path(__file__).parent / "templates" / (method + ".jinja")
     else:
         template_path = Path(template)
-    logger.info("Load template `%s`", template_path)
-    with template_path.open() as fp:
-        script_template = fp.read()
+    return template_path.resolve()
 
-    # prepare submission script
-    script_args: dict[str, Any] = {
-        "PACKAGE_PATH": Path(__file__).parents[2],
-        "JOB_NAME": name,
-        "MODEL_FILE": escape_string(script),
-        "USE_MODELRUNNER": use_modelrunner,
-        "CONFIG": configuration,
-    }
-    if log_folder is not None:
-        ensure_directory_exists(log_folder)
-        script_args["LOG_FOLDER"] = log_folder
-
-    # add the parameters to the job arguments
-    job_args = []
-    if parameters is not None and len(parameters) > 0:
-        if isinstance(parameters, dict):
-            parameters_json = json.dumps(parameters)
-        elif isinstance(parameters, str):
-            parameters_json = parameters
-        else:
-            raise TypeError("Parameters need to be given as a string or a dict")
-        job_args.append(f"--json {escape_string(parameters_json)}")
-        script_args["PARAMETERS"] = parameters  # allow using parameters in job script
 
-    logger.debug("Job arguments: `%s`", job_args)
+def _get_template(method: str, template: str | Path | None = None) -> Template:
+    """Obtain the compiled template of the submission script.
 
-    # add the output folder to the job arguments
-    if output:
-        output = Path(output)
-        if output.is_file():
-            # output is an existing file, so we need to decide what to do with this
-            if overwrite_strategy == "error":
-                raise RuntimeError(f"Output file `{output}` already exists")
-            elif overwrite_strategy == "warn_skip":
-                warnings.warn(f"Output file `{output}` already exists")
-                return "", f"Output file `{output}` already exists"  # do nothing
-            elif overwrite_strategy == "silent_skip":
-                return "", f"Output file `{output}` already exists"  # do nothing
-            elif overwrite_strategy == "overwrite":
-                warnings.warn(f"Output file `{output}` will be overwritten")
-            elif overwrite_strategy == "silent_overwrite":
-                pass
-            else:
-                raise NotImplementedError(f"Unknown strategy `{overwrite_strategy}`")
+    Args:
+        method (str):
+            The submission method, which determines the default template
+        template (str of :class:`~pathlib.Path`):
+            Jinja template file for submission script. If omitted, a standard template
+            is chosen based on the submission method.
 
-            # delete old output
-            output.unlink()
+    Returns:
+        :class:`jinja2.Template`: The compiled template
+    """
+    template_path = _get_template_path(method, template)
+    _logger.info("Load template `%s`", template_path)
+    return _load_template(str(template_path), template_path.stat().st_mtime_ns)
 
-        # check whether output points to a directory or whether this should be a file
-        if output.is_dir():
-            script_args["OUTPUT_FOLDER"] = shlex.quote(str(output))
-        else:
-            script_args["OUTPUT_FOLDER"] = shlex.quote(str(output.parent))
-            job_args.append(f"--output {escape_string(output)}")
 
-    else:
-        # if `output` is not specified, save data to current directory
-        script_args["OUTPUT_FOLDER"] = "."
-    script_args["JOB_ARGS"] = " ".join(job_args)
+def _submit_script(script_content: str, method: str) -> tuple[str, str]:
+    """Submit a rendered script using the given method.
 
-    # replace parameters in submission script template
-    script_content = Template(script_template).render(script_args)
-    logger.debug("Script: `%s`", script_content)
+    Args:
+        script_content (str):
+            The content of the submission script
+        method (str):
+            Specifies the submission method. Currently `background`, `foreground`,
+            'srun', and `qsub` are supported.
 
+    Returns:
+        tuple: The result `(stdout, stderr)` of the submission call.
+    """
     if method in {"qsub", "srun"}:
         # submit job to queue
         proc = sp.Popen(
@@ -300,9 +336,405 @@ def submit_job(
     else:
         raise ValueError(f"Unknown submit method `{method}`")
 
+    # The script is passed as a whole instead of streaming the rendered template into
+    # the pipe: `communicate` reads stdout and stderr while writing, which prevents a
+    # deadlock when a foreground job produces output before the script has been fully
+    # written. Submission scripts are small, so the extra copy does not matter.
     return proc.communicate(script_content)
 
 
+# placeholders for the template arguments that differ between jobs of a sweep
+_PLACEHOLDERS = {
+    "JOB_NAME": "\0JOB_NAME\0",
+    "JOB_ARGS": "\0JOB_ARGS\0",
+    "OUTPUT_FOLDER": "\0OUTPUT_FOLDER\0",
+}
+
+
+def _is_truth_test(node) -> bool:
+    """Check whether a Jinja expression only tests variables for truthiness."""
+    from jinja2 import nodes
+
+    if isinstance(node, nodes.Name):
+        return True
+    if isinstance(node, (nodes.And, nodes.Or)):
+        return _is_truth_test(node.left) and _is_truth_test(node.right)
+    if isinstance(node, nodes.Not):
+        return _is_truth_test(node.node)
+    if isinstance(node, nodes.Test) and node.name == "defined":
+        return isinstance(node.node, nodes.Name)
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _analyze_template(path: str, mtime: int) -> bool:
+    """Check whether a template can be rendered using a skeleton, caching the result.
+
+    This is the case if the template does not use the parameters of the job and only
+    inserts the arguments that differ between jobs verbatim or tests their truthiness.
+
+    Args:
+        path (str):
+            The resolved path to the template file
+        mtime (int):
+            The modification time of the file, which is only used to invalidate the
+            cache when the template file changes
+
+    Returns:
+        bool: Whether :func:`_render_skeleton` can be used
+    """
+    from jinja2 import Environment, nodes
+
+    with Path(path).open() as fp:
+        ast = Environment().parse(fp.read())
+
+    # collect all uses of variables and the uses that are compatible with a skeleton
+    used = [node.name for node in ast.find_all(nodes.Name)]
+    if "PARAMETERS" in used:
+        return False
+    compatible = [
+        node.name
+        for output in ast.find_all(nodes.Output)
+        for node in output.nodes
+        if isinstance(node, nodes.Name)
+    ]
+    for if_node in ast.find_all(nodes.If):
+        if _is_truth_test(if_node.test):
+            compatible.extend(node.name for node in if_node.test.find_all(nodes.Name))
+            if isinstance(if_node.test, nodes.Name):
+                compatible.append(if_node.test.name)
+    return all(used.count(key) == compatible.count(key) for key in _PLACEHOLDERS)
+
+
+def _supports_skeleton(template_path: Path) -> bool:
+    """Check whether a template file can be rendered using a skeleton.
+
+    Args:
+        template_path (:class:`~pathlib.Path`):
+            The resolved path to the template file
+
+    Returns:
+        bool: Whether :func:`_render_skeleton` can be used
+    """
+    return _analyze_template(str(template_path), template_path.stat().st_mtime_ns)
+
+
+def _render_skeleton(
+    script_template: Template, script_args: dict[str, Any]
+) -> str | None:
+    """Render a template with placeholders for the arguments that differ between jobs.
+
+    This only works for templates that insert these arguments verbatim and do not
+    depend on the parameters of the job otherwise, which can be checked using
+    :func:`_supports_skeleton`.
+
+    Args:
+        script_template (:class:`jinja2.Template`):
+            The compiled template of the submission script
+        script_args (dict):
+            The arguments determined by :func:`_get_script_args` for any of the jobs
+
+    Returns:
+        str: The skeleton of the submission script, which can be completed using
+        :func:`_fill_skeleton`, or `None` if the placeholders cannot be used since
+        they collide with other arguments
+    """
+    skeleton = script_template.render({**script_args, **_PLACEHOLDERS})
+    remainder = skeleton
+    for placeholder in _PLACEHOLDERS.values():
+        remainder = remainder.replace(placeholder, "")
+    return None if "\0" in remainder else skeleton
+
+
+def _can_fill_skeleton(script_args: dict[str, Any]) -> bool:
+    """Check whether the arguments of a job can be inserted into a skeleton.
+
+    The skeleton assumes that all inserted values are true and they must not contain
+    the character used to mark placeholders.
+    """
+    return all(
+        script_args[key] and "\0" not in script_args[key] for key in _PLACEHOLDERS
+    )
+
+
+def _fill_skeleton(skeleton: str, script_args: dict[str, Any]) -> str:
+    """Insert the arguments of a particular job into a skeleton script.
+
+    Args:
+        skeleton (str):
+            The skeleton returned by :func:`_render_skeleton`
+        script_args (dict):
+            The arguments determined by :func:`_get_script_args`
+
+    Returns:
+        str: The content of the submission script
+    """
+    script_content = skeleton
+    for key, placeholder in _PLACEHOLDERS.items():
+        script_content = script_content.replace(placeholder, script_args[key])
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Script: `%s`", script_content)
+    return script_content
+
+
+class BatchSubmitter:
+    """Submits rendered scripts concurrently using a pool of threads.
+
+    The submission calls are run in worker threads, so the latency of spawning the
+    submission process and waiting for the scheduler overlaps with preparing the next
+    job. The results are collected when the submitter is closed.
+
+    Example:
+        .. code-block:: python
+
+            with BatchSubmitter("qsub", max_workers=4) as submitter:
+                for script_content in scripts:
+                    submitter.submit(script_content)
+            outs_errs = submitter.results
+    """
+
+    def __init__(self, method: str, *, max_workers: int = 1):
+        """
+        Args:
+            method (str):
+                Specifies the submission method. See :func:`submit_job` for details.
+            max_workers (int):
+                Maximal number of submissions that run concurrently
+        """
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer")
+        self.method = method
+        self.max_workers = max_workers
+        self.results: list[tuple[str, str]] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: list[Future[tuple[str, str]]] = []
+
+    def submit(self, script_content: str) -> None:
+        """Submit a single rendered script.
+
+        Args:
+            script_content (str):
+                The content of the submission script
+        """
+        if self.max_workers == 1:
+            # run submission directly to avoid the overhead of the thread pool
+            self.results.append(_submit_script(script_content, self.method))
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            future = self._executor.submit(_submit_script, script_content, self.method)
+            self._futures.append(future)
+
+    def close(self, *, progress: bool = False) -> list[tuple[str, str]]:
+        """Wait for all submissions to finish.
+
+        Args:
+            progress (bool):
+                Flag indicating whether a progress bar of finished submissions is shown
+
+        Returns:
+            list: The results `(stdout, stderr)` of all submissions in order
+        """
+        if self._executor is not None:
+            try:
+                # reap submissions as they finish, so errors are raised immediately
+                finished = as_completed(self._futures)
+                if progress:
+                    from tqdm.auto import tqdm
+
+                    finished = tqdm(finished, total=len(self._futures))
+                for future in finished:
+                    future.result()
+                self.results.extend(future.result() for future in self._futures)
+            finally:
+                self._executor.shutdown()
+                self._executor = None
+                self._futures = []
+        return self.results
+
+    def __enter__(self) -> BatchSubmitter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _get_script_args(
+    model_file: str,
+    output: str | Path | None,
+    name: str,
+    parameters: str | dict[str, Any] | None,
+    configuration: Config,
+    *,
+    log_folder: str | Path | None,
+    use_modelrunner: bool,
+    overwrite_handler: Callable[[Path], bool],
+    parameters_json: str | None = None,
+) -> dict[str, Any] | None:
+    """Determine the arguments used to render the template of the submission script.
+
+    The arguments are described in :func:`submit_job`, except that `model_file` is the
+    path to the script that has already been escaped for the command line and
+    `overwrite_handler` is the handler returned by :func:`_get_overwrite_handler`.
+    Additionally, `parameters_json` can supply the JSON-encoded `parameters` if they
+    have been serialized already.
+
+    Returns:
+        dict: The arguments for the template or `None` if the job is skipped
+    """
+    # prepare submission script
+    script_args: dict[str, Any] = {
+        "PACKAGE_PATH": Path(__file__).parents[2],
+        "JOB_NAME": name,
+        "MODEL_FILE": model_file,
+        "USE_MODELRUNNER": use_modelrunner,
+        "CONFIG": configuration,
+    }
+    if log_folder is not None:
+        script_args["LOG_FOLDER"] = log_folder
+
+    # add the parameters to the job arguments
+    job_args = []
+    if parameters is not None and len(parameters) > 0:
+        if parameters_json is None:
+            if isinstance(parameters, dict):
+                parameters_json = _encode_json(parameters)
+            elif isinstance(parameters, str):
+                parameters_json = parameters
+            else:
+                raise TypeError("Parameters need to be given as a string or a dict")
+        job_args.append(f"--json {escape_string(parameters_json)}")
+        script_args["PARAMETERS"] = parameters  # allow using parameters in job script
+
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Job arguments: `%s`", job_args)
+
+    # add the output folder to the job arguments
+    if output:
+        output = Path(output)
+        # determine the type of the output path with a single `stat` call
+        try:
+            output_mode = output.stat().st_mode
+        except (OSError, ValueError):
+            # like `Path.is_file`, treat paths that cannot be inspected as missing
+            output_mode = 0
+
+        if stat.S_ISREG(output_mode):
+            # output is an existing file, so we need to decide what to do with this
+            if overwrite_handler(output):
+                return None  # skip this job
+            output_mode = 0  # old output has been deleted
+
+        # check whether output points to a directory or whether this should be a file
+        if stat.S_ISDIR(output_mode):
+            script_args["OUTPUT_FOLDER"] = shlex.quote(str(output))
+        else:
+            script_args["OUTPUT_FOLDER"] = shlex.quote(str(output.parent))
+            job_args.append(f"--output {escape_string(output)}")
+
+    else:
+        # if `output` is not specified, save data to current directory
+        script_args["OUTPUT_FOLDER"] = "."
+    script_args["JOB_ARGS"] = " ".join(job_args)
+    return script_args
+
+
+def _render_script(script_template: Template, script_args: dict[str, Any]) -> str:
+    """Replace parameters in the template of the submission script.
+
+    Args:
+        script_template (:class:`jinja2.Template`):
+            The compiled template of the submission script
+        script_args (dict):
+            The arguments determined by :func:`_get_script_args`
+
+    Returns:
+        str: The content of the submission script
+    """
+    script_content = script_template.render(script_args)
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug("Script: `%s`", script_content)
+    return script_content
+
+
+def submit_job(
+    script: str | Path,
+    output: str | Path | None = None,
+    name: str = "job",
+    parameters: str | dict[str, Any] | None = None,
+    config: str | dict[str, Any] | None = None,
+    *,
+    log_folder: str | Path | None = None,
+    method: str = "auto",
+    use_modelrunner: bool = True,
+    template: str | Path | None = None,
+    overwrite_strategy: OverwriteStrategyType = "error",
+    **kwargs,
+) -> tuple[str, str]:
+    """Submit a script to the cluster queue.
+
+    Args:
+        script (str of :class:`~pathlib.Path`):
+            Path to the script file, which contains the model
+        output (str of :class:`~pathlib.Path`):
+            Path to the output file, where all the results are saved
+        name (str):
+            Name of the job
+        parameters (str or dict):
+            Parameters for the script, either as a python dictionary or a string
+            containing a JSON-encoded dictionary.
+        config (str or dict):
+            Configuration for the job, which determines how the job is run. Can be either
+            a python dictionary or a string containing a JSON-encoded dictionary.
+        log_folder (str of :class:`~pathlib.Path`):
+            Path to the logging folder. If omitted, the default of the template is used,
+            which typically sends data to stdout for local scripts (which is thus
+            captured and returned by this function) or writes log files to the current
+            working directory for remote jobs.
+        method (str):
+            Specifies the submission method. Currently `background`, `foreground`,
+            'srun', and `qsub` are supported. The special value `auto` reads the method
+            from the `config` argument.
+        use_modelrunner (bool):
+            If True, `script` is envoked with the modelrunner library, e.g. by calling
+            `python -m modelrunner {script}`.
+        template (str of :class:`~pathlib.Path`):
+            Jinja template file for submission script. If omitted, a standard template
+            is chosen based on the submission method.
+        overwrite_strategy (str):
+            Determines what to do when files already exist. Possible options include
+            `error`, `warn_skip`, `silent_skip`, `overwrite`, and `silent_overwrite`.
+
+    Returns:
+        tuple: The result `(stdout, stderr)` of the submission call. These two strings
+            can contain the output from the actual scripts that is run when `log_folder`
+            is `None`.
+    """
+    # prepare job configuration
+    configuration = _get_configuration(config, kwargs)
+
+    # determine the submission method and the associated template
+    if method == "auto":
+        method = configuration["method"]
+    script_template = _get_template(method, template)
+    if log_folder is not None:
+        ensure_directory_exists(log_folder)
+
+    script_args = _get_script_args(
+        escape_string(script),
+        output,
+        name,
+        parameters,
+        configuration,
+        log_folder=log_folder,
+        use_modelrunner=use_modelrunner,
+        overwrite_handler=_get_overwrite_handler(overwrite_strategy),
+    )
+    if script_args is None:
+        return "", f"Output file `{output}` already exists"  # job was skipped
+    return _submit_script(_render_script(script_template, script_args), method)
+
+
 def submit_jobs(
     script: str | Path,
     output_folder: str | Path,
@@ -312,10 +744,21 @@ def submit_jobs(
     *,
     output_format: str = "hdf",
     list_params: Iterable[str] | None = None,
+    log_folder: str | Path | None = None,
+    method: str = "auto",
+    use_modelrunner: bool = True,
+    template: str | Path | None = None,
+    overwrite_strategy: OverwriteStrategyType = "error",
+    max_workers: int = 1,
+    array: bool = False,
     **kwargs,
 ) -> int:
     """Submit many jobs of the same script with different parameters to the cluster.
 
+    By default, every job requires a separate call to the submission program, which
+    can be slow for large parameter sweeps. In this case, the calls can either be
+    overlapped by setting `max_workers` or combined into a single call using `array`.
+
     Args:
         script (str of :class:`~pathlib.Path`):
             Path to the script file, which contains the model
@@ -336,49 +779,136 @@ def submit_jobs(
         list_params (list):
             List of parameters that are meant to be lists. They will be submitted as
             individual parameters and not iterated over to produce multiple jobs.
-        **kwargs:
-            All additional parameters are forwarded to :func:`submit_job`.
+        log_folder (str of :class:`~pathlib.Path`):
+            Path to the logging folder. See :func:`submit_job` for details.
+        method (str):
+            Specifies the submission method. See :func:`submit_job` for details.
+        use_modelrunner (bool):
+            If True, `script` is envoked with the modelrunner library.
+        template (str of :class:`~pathlib.Path`):
+            Jinja template file for submission script. If omitted, a standard template
+            is chosen based on the submission method.
+        overwrite_strategy (str):
+            Determines what to do when files already exist. See :func:`submit_job`
+            for details.
+        max_workers (int):
+            Number of jobs that are submitted concurrently. Values larger than 1 allow
+            overlapping the latency of the submission calls, e.g., of `qsub`.
+        array (bool):
+            If True, all jobs are submitted as a single array job, which requires only
+            one call to the scheduler. This is only supported for the `qsub` method;
+            jobs are submitted individually for all other methods. Custom templates
+            receive the escaped arguments of all jobs in the list `JOBS`.
 
     Returns:
         int: The number of jobs that have been submitted
     """
+    from tqdm.auto import tqdm
+
     if parameters is None:
         parameter_dict = {}
     elif isinstance(parameters, str):
         parameter_dict = json.loads(parameters)
     else:
         parameter_dict = parameters
-    if list_params is None:
-        list_params = set()
+    list_params = frozenset() if list_params is None else frozenset(list_params)
 
-    # detect varying parameters
+    # detect varying parameters, starting with the cheapest checks
     params, p_vary = {}, {}
     for name, value in parameter_dict.items():
         if (
-            hasattr(value, "__iter__")
-            and not isinstance(value, str)
-            and name not in list_params
+            name in list_params
+            or isinstance(value, str)
+            or not hasattr(value, "__iter__")
         ):
-            p_vary[name] = value
-        else:
             params[name] = value
+        else:
+            p_vary[name] = value
 
-    # build the list of all varying arguments
-    p_vary_list = [
-        dict(zip(p_vary.keys(), values))
-        for values in itertools.product(*p_vary.values())
+    # build the list of all varying arguments together with the associated job names.
+    # The parts of the job names are formatted once per value and then combined.
+    p_vary_values = [list(values) for values in p_vary.values()]
+    name_parts = [
+        [_get_job_name_part(name, value) for value in values]
+        for name, values in zip(p_vary, p_vary_values)
     ]
+    p_vary_list = list(itertools.product(*p_vary_values))
+    name_stem = name_base[:-1] if name_base.endswith("_") else name_base
+    name_list = [name_stem + "".join(parts) for parts in itertools.product(*name_parts)]
 
     if not output_format.startswith("."):
         output_format = "." + output_format
 
+    # determine the configuration and the template once for all jobs
+    configuration = _get_configuration(config, kwargs)
+    if method == "auto":
+        method = configuration["method"]
+    array = array and method == "qsub"
+    script_template = _get_template(method + "_array" if array else method, template)
+    if log_folder is not None:
+        ensure_directory_exists(log_folder)
+
+    # escape the script path and serialize the shared parameters only once
+    overwrite_handler = _get_overwrite_handler(overwrite_strategy)
+    model_file = escape_string(script)
+    params_json = _encode_json(params)
+
+    # Templates that only insert the arguments that vary between jobs, like the default
+    # ones, can be rendered once and completed for each job by string replacement
+    use_skeleton = not array and _supports_skeleton(
+        _get_template_path(method, template)
+    )
+    skeleton: str | None = None
+
     # submit jobs with all parameter variations
-    for p_job in tqdm(p_vary_list):
-        params.update(p_job)
-        name = get_job_name(name_base, p_job)
-        output = Path(output_folder) / f"{name}{output_format}"
-        submit_job(
-            script, output=output, name=name, parameters=params, config=config, **kwargs
-        )
+    array_jobs, script_args = [], None
+    # show the progress of preparing jobs or, for concurrent submission, of finished jobs
+    concurrent = max_workers > 1 and not array
+    with BatchSubmitter(method, max_workers=max_workers) as submitter:
+        jobs = zip(p_vary_list, name_list)
+        for values, name in tqdm(jobs, total=len(p_vary_list), disable=concurrent):
+            p_job = dict(zip(p_vary, values))
+            job_params = {**params, **p_job}  # separate copy for each job
+            if not p_job:
+                job_json = params_json
+            elif not params_json[1:-1]:
+                job_json = _encode_json(p_job)
+            else:  # combine the shared and the varying parameters
+                job_json = params_json[:-1] + ", " + _encode_json(p_job)[1:]
+            output = Path(output_folder) / f"{name}{output_format}"
+            job_args = _get_script_args(
+                model_file,
+                output,
+                name,
+                job_params,
+                configuration,
+                log_folder=log_folder,
+                use_modelrunner=use_modelrunner,
+                overwrite_handler=overwrite_handler,
+                parameters_json=job_json,
+            )
+            if job_args is None:
+                continue  # job is skipped
+            script_args = job_args
+            if array:
+                array_jobs.append(escape_string(script_args["JOB_ARGS"]))
+                continue
+            if use_skeleton:
+                # render the skeleton only once, using the arguments of the first job
+                skeleton = _render_skeleton(script_template, script_args)
+                use_skeleton = False
+            if skeleton is not None and _can_fill_skeleton(script_args):
+                submitter.submit(_fill_skeleton(skeleton, script_args))
+            else:
+                submitter.submit(_render_script(script_template, script_args))
+
+        if array_jobs and script_args is not None:
+            # submit all jobs as a single array job
+            script_args.pop("PARAMETERS", None)
+            script_args["JOB_NAME"] = name_stem
+            script_args["JOBS"] = array_jobs
+            submitter.submit(_render_script(script_template, script_args))
+
+        submitter.close(progress=concurrent)
 
     return len(p_vary_list)
@@ -10,11 +10,11 @@ import inspect
 import itertools
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Collection, Iterator, List
 
 import numpy as np
-from tqdm.auto import tqdm
 
 from ..model.base import ModelBase
 from ..storage import Location, StorageGroup, StorageID, open_storage, storage_actions
@@ -160,6 +160,7 @@ class Result:
         loc: Location = None,
         *,
         model: ModelBase | None = None,
+        **kwargs,
     ):
         """Load object from a file.
 
@@ -177,6 +178,9 @@ class Result:
                 rarely be modified.
             model (:class:`~modelrunner.model.ModelBase`):
                 The model which lead to this result
+            **kwargs:
+                Additional arguments are passed to the storage class, e.g., to set the
+                chunk cache of :class:`~modelrunner.storage.backend.hdf.HDFStorage`
         """
         if isinstance(storage, (str, Path)) and (isinstance(loc, str) or loc is None):
             # check whether the file was written with an old format version
@@ -187,13 +191,15 @@ class Result:
                 return result  # Result created from old version
 
         # assume that file was written with latest format version
-        with open_storage(storage, mode="read") as storage_obj:
+        with open_storage(storage, mode="read", **kwargs) as storage_obj:
             attrs = storage_obj.read_attrs(loc)
             format_version = attrs.pop("format_version", None)
             if format_version == cls._format_version:
                 # current version of storing results
                 if "storage" in storage_obj:
-                    data_storage = open_storage(storage, loc="storage", mode="read")
+                    data_storage = open_storage(
+                        storage, loc="storage", mode="read", **kwargs
+                    )
                 else:
                     data_storage = None
                 return cls.from_data(
@@ -208,7 +214,12 @@ class Result:
                 raise RuntimeError(f"Cannot read format version {format_version}")
 
     def to_file(
-        self, storage: StorageID, loc: Location = None, *, mode: ModeType = "insert"
+        self,
+        storage: StorageID,
+        loc: Location = None,
+        *,
+        mode: ModeType = "insert",
+        **kwargs,
     ) -> None:
         """Write the results to a file.
 
@@ -226,8 +237,11 @@ class Result:
                 The file mode with which the storage is accessed, which determines the
                 allowed operations. Common options are "read", "full", "append", and
                 "truncate".
+            **kwargs:
+                Additional arguments are passed to the storage class, e.g., to choose
+                the `compression` of :class:`~modelrunner.storage.backend.hdf.HDFStorage`
         """
-        with open_storage(storage, loc=loc, mode=mode) as storage_obj:
+        with open_storage(storage, loc=loc, mode=mode, **kwargs) as storage_obj:
             # collect attributes from the result
             attrs: Attrs = {
                 # "model": dict(self.model._state_attributes),
@@ -260,6 +274,7 @@ class ResultCollection(List[Result]):
         *,
         strict: bool = False,
         progress: bool = False,
+        max_workers: int = 1,
     ):
         """Create results collection from a folder.
 
@@ -275,27 +290,41 @@ class ResultCollection(List[Result]):
                 be read
             progress (bool):
                 Flag indicating whether a progress bar is shown
+            max_workers (int):
+                Number of threads used to read files concurrently. Values larger than
+                one mostly help when files are located on storage with high latency,
+                like network file systems.
         """
+        from tqdm.auto import tqdm
+
         logger = logging.getLogger("modelrunner." + cls.__name__)
 
         folder = Path(folder)
         if not folder.is_dir():
             logger.warning("%s is not a directory", folder)
 
-        # iterate over all files and load them as a Result
-        results = []
-        for path in tqdm(list(folder.glob(pattern)), disable=not progress):
-            if path.is_file():
-                try:
-                    result = Result.from_file(path, model=model)
-                except Exception as err:
-                    if strict:
-                        err.args = (str(err) + f"\nError reading file `{path}`",)
-                        raise
-                    else:
-                        logger.warning("Error reading file `%s`", path)
+        def read_result(path: Path) -> Result | None:
+            """Load a single file as a Result."""
+            try:
+                result: Result = Result.from_file(path, model=model)
+            except Exception as err:
+                if strict:
+                    err.args = (str(err) + f"\nError reading file `{path}`",)
+                    raise
                 else:
-                    results.append(result)
+                    logger.warning("Error reading file `%s`", path)
+                    return None
+            return result
+
+        # iterate over all files and load them as a Result
+        paths = [path for path in folder.glob(pattern) if path.is_file()]
+        pbar_args = {"total": len(paths), "disable": not progress}
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                items = list(tqdm(executor.map(read_result, paths), **pbar_args))
+        else:
+            items = list(tqdm(map(read_result, paths), **pbar_args))
+        results = [result for result in items if result is not None]
 
         # raise a warning if no results were detected
         if not results:
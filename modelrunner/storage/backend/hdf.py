@@ -8,6 +8,7 @@ Requires the optional :mod:`h5py` module.
 
 from __future__ import annotations
 
+import weakref
 from pathlib import Path
 from typing import Any, Collection, Sequence
 
@@ -20,6 +21,15 @@ from ..attributes import AttrsLike, encode_attr
 from ..base import StorageBase
 from ..utils import decode_binary, encode_binary
 
+SINGLE_CHUNK_SIZE = 1024**2
+"""int: arrays smaller than this number of bytes are stored in a single chunk"""
+DYNAMIC_CHUNK_ITEMS = 1024
+"""int: maximal number of items stored in a single chunk of a dynamic array"""
+CHUNK_CACHE_SIZE = 64 * 1024**2
+"""int: default size of the raw data chunk cache in bytes"""
+CHUNK_CACHE_SLOTS = 100_003
+"""int: default number of slots in the chunk cache (preferably a prime number)"""
+
 
 class HDFStorage(StorageBase):
     """Storage that stores data in an HDF file."""
@@ -31,7 +41,9 @@ class HDFStorage(StorageBase):
         file_or_path: str | Path | h5py.File,
         *,
         mode: ModeType = "read",
-        compression: bool = True,
+        compression: bool | str = True,
+        rdcc_nbytes: int = CHUNK_CACHE_SIZE,
+        rdcc_nslots: int = CHUNK_CACHE_SLOTS,
     ):
         """
         Args:
@@ -40,19 +52,44 @@ class HDFStorage(StorageBase):
             mode (str or :class:`~modelrunner.storage.access_modes.AccessMode`):
                 The file mode with which the storage is accessed. Determines allowed
                 operations.
-            compression (bool):
+            compression (bool or str):
                 Whether to store the data in compressed form. Automatically enabled
-                chunked storage.
+                chunked storage. A string selects the HDF5 compression filter, e.g.,
+                `gzip` (used when `True` is given) or `lzf`, which is considerably
+                faster at the cost of slightly larger files.
+            rdcc_nbytes (int):
+                Size of the raw data chunk cache in bytes. The h5py default of 1 MiB
+                leads to repeated decompression of chunks when many of them are used.
+                Only used when a path is given.
+            rdcc_nslots (int):
+                Number of slots in the hash table of the chunk cache. Only used when a
+                path is given.
         """
         super().__init__(mode=mode)
         self.compression = compression
         self._dynamic_array_size: dict[str, int] = {}  # lengths of the dynamic arrays
+        # items appended to dynamic arrays are buffered and written one chunk at a time.
+        # The finalizer writes the buffers of storages that have not been closed, e.g.,
+        # when the interpreter exits. It only refers to the buffers and the datasets,
+        # which keep the HDF file open until the items have been written
+        self._append_buffers: dict[str, tuple[h5py.Dataset, list]] = {}
+        self._finalizer = weakref.finalize(
+            self,
+            self._flush_append_buffers,
+            self._append_buffers,
+            self._dynamic_array_size,
+        )
 
         if isinstance(file_or_path, (str, Path)):
             # open HDF storage on file system
             self._close = True
             file_mode = self.mode.file_mode
-            self._file = h5py.File(file_or_path, mode=file_mode)
+            self._file = h5py.File(
+                file_or_path,
+                mode=file_mode,
+                rdcc_nbytes=rdcc_nbytes,
+                rdcc_nslots=rdcc_nslots,
+            )
 
         elif isinstance(file_or_path, h5py.File):
             # use opened HDF file
@@ -68,14 +105,44 @@ class HDFStorage(StorageBase):
             f'mode="{self.mode.name}")'
         )
 
+    @property
+    def thread_safe(self) -> bool:
+        """bool: indicates whether items can be read from several threads at once"""
+        # h5py serializes all calls into the HDF5 library using a global lock
+        return True
+
+    def flush(self) -> None:
+        """Write (cached) data to storage."""
+        self._flush_append_buffers(self._append_buffers, self._dynamic_array_size)
+        self._append_buffers.clear()
+
     def close(self) -> None:
-        # shorten dynamic arrays to correct size
-        for hdf_path, size in self._dynamic_array_size.items():
-            self._file[hdf_path].resize(size, axis=0)
+        self.flush()
         if self._close:
             self._file.close()
         super().close()
 
+    def _get_compression_args(self, arr: np.ndarray) -> dict[str, Any]:
+        """Determine the arguments for creating a compressed dataset.
+
+        Args:
+            arr (:class:`~numpy.ndarray`):
+                The array that will be stored in the dataset
+
+        Returns:
+            dict: Arguments passed to :meth:`h5py.Group.create_dataset`
+        """
+        if not self.compression or arr.ndim == 0:
+            return {}  # scalar datasets do not support compression
+        args: dict[str, Any] = {
+            "compression": "gzip" if self.compression is True else self.compression
+        }
+        if 0 < arr.nbytes < SINGLE_CHUNK_SIZE:
+            # store small arrays in a single chunk instead of the automatically chosen
+            # chunks, which can be wasteful for tiny arrays
+            args["chunks"] = arr.shape
+        return args
+
     def _get_hdf_path(self, loc: Sequence[str]) -> str:
         return "/" + "/".join(loc)
 
@@ -152,8 +219,9 @@ class HDFStorage(StorageBase):
         self[loc].attrs[name] = value
 
     def _read_array(
-        self, loc: Sequence[str], *, copy: bool, index: int | None = None
+        self, loc: Sequence[str], *, copy: bool, index: int | slice | None = None
     ) -> np.ndarray:
+        self.flush()  # make sure all appended items are available
         if index is None:
             arr_like = self[loc]
         else:
@@ -178,7 +246,7 @@ class HDFStorage(StorageBase):
             )
 
         # convert it into the right type
-        arr = np.array(arr_like, copy=copy)
+        arr = np.array(arr_like, copy=True) if copy else np.asarray(arr_like)
         if attrs.get("__recarray__", False):
             arr = arr.view(np.recarray)
 
@@ -206,7 +274,7 @@ class HDFStorage(StorageBase):
                 dataset = parent.create_dataset(name, data=np.void(arr_bin))
                 dataset.attrs["__pickled__"] = True
             else:
-                args = {"compression": "gzip"} if self.compression else {}
+                args = self._get_compression_args(arr)
                 dataset = parent.create_dataset(name, data=arr, **args)
 
             if isinstance(arr, np.recarray):
@@ -225,7 +293,7 @@ class HDFStorage(StorageBase):
             try:
                 dataset = parent.create_dataset(
                     name,
-                    shape=(1,) + shape,
+                    shape=(0,) + shape,
                     maxshape=(None,) + shape,
                     dtype=h5py.vlen_dtype(np.uint8),
                 )
@@ -234,11 +302,17 @@ class HDFStorage(StorageBase):
             dataset.attrs["__pickled__"] = encode_attr(True)
 
         else:
-            args = {"compression": "gzip"} if self.compression else {}
+            args = self._get_compression_args(np.empty((0,) + shape, dtype=dtype))
+            if all(shape):
+                # store many complete items in each chunk instead of letting h5py guess
+                # the chunks from the initial shape, which splits single items
+                item_size = np.dtype(dtype).itemsize * int(np.prod(shape))
+                items = min(SINGLE_CHUNK_SIZE // max(item_size, 1), DYNAMIC_CHUNK_ITEMS)
+                args["chunks"] = (max(items, 1),) + shape
             try:
                 dataset = parent.create_dataset(
                     name,
-                    shape=(1,) + shape,
+                    shape=(0,) + shape,
                     maxshape=(None,) + shape,
                     dtype=dtype,
                     **args,
@@ -250,35 +324,69 @@ class HDFStorage(StorageBase):
         if record_array:
             dataset.attrs["__recarray__"] = True
 
-    def _extend_dynamic_array(self, loc: Sequence[str], arr: ArrayLike) -> None:
-        # load the dataset
-        hdf_path = self._get_hdf_path(loc)
-        dataset = self._file[hdf_path]
+    @staticmethod
+    def _flush_append_buffers(
+        append_buffers: dict[str, tuple[h5py.Dataset, list]],
+        dynamic_array_size: dict[str, int],
+    ) -> None:
+        """Write all items that have been buffered for dynamic arrays.
 
-        if not dataset.maxshape[0] == None:
-            raise RuntimeError(f"Array `/{'/'.join(loc)}` is not resizeable")
+        Args:
+            append_buffers (dict):
+                The buffers containing the datasets and the items to append
+            dynamic_array_size (dict):
+                The lengths of the dynamic arrays, which will be updated
+        """
+        for hdf_path, (dataset, items) in append_buffers.items():
+            if not items or not dataset:
+                continue  # nothing to write or the file has been closed already
+
+            # determine size of the currently written data
+            size = dynamic_array_size.get(hdf_path)
+            if size is None:
+                # we extend a dataset that has not been created by this instance.
+                # Assume that it has the correct size
+                size = dataset.shape[0]
+
+            # make space for all buffered items and write them in one go
+            new_size = size + len(items)
+            dataset.resize(new_size, axis=0)
+            if dataset.dtype == object:
+                # h5py cannot reliably write slices of variable-length data
+                for i, item in enumerate(items):
+                    dataset[size + i] = item
+            else:
+                batch = np.empty((len(items),) + dataset.shape[1:], dtype=dataset.dtype)
+                for i, item in enumerate(items):
+                    batch[i] = item
+                dataset[size:new_size] = batch
 
-        # determine size of the currently written data
-        size = self._dynamic_array_size.get(hdf_path, None)
-        if size is None:
-            # we extend a dataset that has not been created by this instance. Assume
-            # that it has the correct size
-            size = dataset.shape[0]
+            dynamic_array_size[hdf_path] = new_size
+            items.clear()
 
-        if dataset.shape[0] <= size:
-            # the old data barely fits into the current size => We need to extend the
-            # array to make space for an additional record. We directly extend by a bit
-            # so we don't need to resize every iteration
-            dataset.resize(size + 1, axis=0)
+    def _extend_dynamic_array(self, loc: Sequence[str], arr: ArrayLike) -> None:
+        hdf_path = self._get_hdf_path(loc)
+        if hdf_path in self._append_buffers:
+            dataset, items = self._append_buffers[hdf_path]
+        else:
+            # load the dataset
+            dataset = self._file[hdf_path]
+            if not dataset.maxshape[0] == None:
+                raise RuntimeError(f"Array `/{'/'.join(loc)}` is not resizeable")
+            dataset, items = self._append_buffers[hdf_path] = (dataset, [])
 
         if dataset.attrs.get("__pickled__", False):
             arr_bin = encode_binary(arr, binary=True)
             assert isinstance(arr_bin, bytes)
-            dataset[size] = np.frombuffer(arr_bin, dtype=np.uint8)
+            items.append(np.frombuffer(arr_bin, dtype=np.uint8))
         else:
-            dataset[size] = arr
+            items.append(np.array(arr, copy=True))  # the caller might modify `arr`
 
-        self._dynamic_array_size[hdf_path] = dataset.shape[0]
+        if len(items) >= (dataset.chunks or (1,))[0]:
+            # write buffered items once they fill a complete chunk. All dynamic arrays
+            # are written together, so related arrays (like the data and the time
+            # points of a trajectory) stay in sync on disk
+            self.flush()
 
     def _read_object(self, loc: Sequence[str]) -> Any:
         return decode_binary(np.asarray(self[loc]).item())
@@ -24,4 +24,6 @@ class JSONStorage(TextStorageBase):
 
     def _write_data_to_fp(self, fp, data) -> None:
         self._write_flags.setdefault("cls", AttrsEncoder)
-        json.dump(data, fp, **self._write_flags)
+        # encoding the whole document at once uses the fast C encoder of the json
+        # module, while `json.dump` always uses the pure python implementation
+        fp.write(json.dumps(data, **self._write_flags))
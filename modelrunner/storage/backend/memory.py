@@ -15,6 +15,9 @@ from ..access_modes import AccessError, ModeType
 from ..attributes import Attrs
 from ..base import StorageBase
 
+_IMMUTABLE_TYPES = {bool, int, float, complex, str, bytes, type(None)}
+"""set: types of objects that can be stored without copying them"""
+
 
 class MemoryStorage(StorageBase):
     """Store items in memory."""
@@ -31,6 +34,11 @@ class MemoryStorage(StorageBase):
         super().__init__(mode=mode)
         self._data = {}
 
+    @property
+    def thread_safe(self) -> bool:
+        """bool: indicates whether items can be read from several threads at once"""
+        return True
+
     def clear(self) -> None:
         """Truncate the storage by removing all stored data.
 
@@ -121,14 +129,14 @@ class MemoryStorage(StorageBase):
             item["__attrs__"][name] = value
 
     def _read_array(
-        self, loc: Sequence[str], *, copy: bool, index: int | None = None
+        self, loc: Sequence[str], *, copy: bool, index: int | slice | None = None
     ) -> np.ndarray:
         # read the data from the location
         if index is None:
             arr = self[loc]["data"]
         else:
             arr = self[loc]["data"][index]
-        return np.array(arr, copy=copy)
+        return np.array(arr, copy=True) if copy else np.asarray(arr)
 
     def _write_array(self, loc: Sequence[str], arr: np.ndarray) -> None:
         parent, name = self._get_parent(loc, check_write=True)
@@ -178,4 +186,10 @@ class MemoryStorage(StorageBase):
 
     def _write_object(self, loc: Sequence[str], obj: Any) -> None:
         parent, name = self._get_parent(loc, check_write=True)
-        parent[name] = {"data": copy.deepcopy(obj)}
+        if type(obj) in _IMMUTABLE_TYPES:
+            data = obj  # immutable objects do not need to be copied
+        elif isinstance(obj, np.ndarray) and obj.dtype != object:
+            data = obj.copy(order="K")  # avoid the generic deepcopy machinery
+        else:
+            data = copy.deepcopy(obj)
+        parent[name] = {"data": data}
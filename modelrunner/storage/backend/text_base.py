@@ -124,7 +124,7 @@ class TextStorageBase(MemoryStorage, metaclass=ABCMeta):
         self._modified = True
 
     def _read_array(
-        self, loc: Sequence[str], *, copy: bool, index: int | None = None
+        self, loc: Sequence[str], *, copy: bool, index: int | slice | None = None
     ) -> np.ndarray:
         # read the data from the location
         if index is None:
@@ -6,12 +6,18 @@ from __future__ import annotations
 
 import numpy as np
 
+_SIMPLE_TYPES = {bool, int, float, str, type(None)}
+"""set: types that are directly supported by text formats"""
+
 
 def simplify_data(data):
     """Simplify data (e.g. for writing to json or yaml)
 
     This function for instance turns sets and numpy arrays into lists.
     """
+    if type(data) in _SIMPLE_TYPES:
+        return data  # most items do not need to be converted
+
     if isinstance(data, dict):
         data = {key: simplify_data(value) for key, value in data.items()}
 
@@ -7,10 +7,15 @@ Requires the optional :mod:`zarr` module.
 
 from __future__ import annotations
 
+import functools
+import mmap
 import shutil
+import threading
+import weakref
 from pathlib import Path
-from typing import Any, Collection, Sequence, Union
+from typing import Any, Callable, Collection, Sequence, TypeVar, Union
 
+import numcodecs
 import numpy as np
 import zarr
 from numpy.typing import ArrayLike, DTypeLike
@@ -21,6 +26,46 @@ from ..attributes import AttrsLike
 from ..base import StorageBase
 
 zarrElement = Union[zarr.Group, zarr.Array]
+TFunc = TypeVar("TFunc", bound=Callable[..., Any])
+
+DYNAMIC_CHUNK_SIZE = 4 * 1024**2
+"""int: targeted size of the chunks of dynamic arrays in bytes"""
+DYNAMIC_CHUNK_ITEMS = 1024
+"""int: maximal number of items stored in a single chunk of a dynamic array"""
+
+_blosc_lock = threading.RLock()  # guards the global threading setting of numcodecs
+
+
+def _apply_blosc_threads(method: TFunc) -> TFunc:
+    """Decorator applying the Blosc threading choice of the storage to a method."""
+
+    @functools.wraps(method)
+    def wrapper(self: ZarrStorage, *args, **kwargs):
+        if self.blosc_threads is None:
+            return method(self, *args, **kwargs)
+        # only change the global setting of numcodecs while the method runs. The lock
+        # prevents other threads from changing the setting concurrently
+        with _blosc_lock:
+            use_threads = numcodecs.blosc.use_threads
+            numcodecs.blosc.use_threads = self.blosc_threads
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                numcodecs.blosc.use_threads = use_threads
+
+    return wrapper  # type: ignore
+
+
+class _MemMapDirectoryStore(zarr.DirectoryStore):
+    """DirectoryStore that maps files into memory instead of reading them."""
+
+    @staticmethod
+    def _fromfile(fn):
+        with Path(fn).open("rb") as fp:
+            try:
+                return memoryview(mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ))
+            except ValueError:
+                return fp.read()  # empty files cannot be mapped
 
 
 class ZarrStorage(StorageBase):
@@ -28,7 +73,20 @@ class ZarrStorage(StorageBase):
 
     extensions = ["zarr", "zip", "sqldb", "lmdb"]
 
-    def __init__(self, store_or_path: str | Path | Store, *, mode: ModeType = "read"):
+    default_compressor = numcodecs.Blosc(
+        cname="zstd", clevel=3, shuffle=numcodecs.Blosc.BITSHUFFLE
+    )
+    """:class:`numcodecs.abc.Codec`: compressor used for numerical arrays."""
+
+    def __init__(
+        self,
+        store_or_path: str | Path | Store,
+        *,
+        mode: ModeType = "read",
+        compression: bool = True,
+        memmap: bool = False,
+        blosc_threads: bool | None = None,
+    ):
         """
         Args:
             store_or_path (str or :class:`~pathlib.Path` or :class:`~zarr._storage.store.Store`):
@@ -36,8 +94,25 @@ class ZarrStorage(StorageBase):
             mode (str or :class:`~modelrunner.storage.access_modes.AccessMode`):
                 The file mode with which the storage is accessed. Determines allowed
                 operations.
+            compression (bool):
+                Whether to compress numerical arrays using :attr:`default_compressor`.
+                Disabling compression can speed up writing intermediate data to fast
+                local disks, where compressing is slower than writing the raw bytes.
+            memmap (bool):
+                Whether files of a directory opened in read mode are mapped into memory
+                instead of being read. This avoids copying data, in particular for
+                uncompressed arrays, and leaves caching to the operating system.
+            blosc_threads (bool, optional):
+                Whether Blosc may use its internal thread pool when this storage
+                compresses or decompresses data. Disabling threads avoids competing
+                with the parallelism of jobs and problems in forked processes. The
+                default `None` keeps the global setting of :mod:`numcodecs`. Since
+                this setting is global, the storage is then only accessed by one
+                thread at a time.
         """
         super().__init__(mode=mode)
+        self.compression = compression
+        self.blosc_threads = blosc_threads
 
         if isinstance(store_or_path, (str, Path)):
             # open zarr storage on file system
@@ -52,10 +127,12 @@ class ZarrStorage(StorageBase):
                 if path.is_dir() and self.mode.file_mode == "w":
                     self._logger.info("Delete directory `{%s}`", path)
                     shutil.rmtree(path)  # remove the directory to reinstate it
-                if self.mode.file_mode == "r":
-                    self._logger.info("DirectoryStore is always opened writable")
-
-                self._store = zarr.DirectoryStore(path)
+                if self.mode.file_mode == "r" and memmap:
+                    self._store = _MemMapDirectoryStore(path)
+                else:
+                    if self.mode.file_mode == "r":
+                        self._logger.info("DirectoryStore is always opened writable")
+                    self._store = zarr.DirectoryStore(path)
 
             elif path.suffix == ".zip":
                 # create a ZipStore
@@ -82,15 +159,79 @@ class ZarrStorage(StorageBase):
 
         self._root = zarr.group(store=self._store, overwrite=False)
 
+        # items appended to dynamic arrays are buffered and written one chunk at a time
+        self._append_buffers: dict[tuple[str, ...], tuple[zarr.Array, list]] = {}
+        self._finalizer = weakref.finalize(
+            self, self._flush_append_buffers, self._append_buffers
+        )
+
     @property
     def can_update(self) -> bool:
         """bool: indicates whether the storage supports updating items"""
         return not isinstance(self._store, zarr.storage.ZipStore)
 
+    @property
+    def thread_safe(self) -> bool:
+        """bool: indicates whether items can be read from several threads at once"""
+        if self.blosc_threads is not None:
+            return False  # access is serialized to apply the Blosc threading choice
+        # stores backed by a single file or database share one handle between threads
+        return isinstance(self._store, (zarr.DirectoryStore, zarr.MemoryStore))
+
     def __repr__(self):
         return f'{self.__class__.__name__}({self._root.store}, mode="{self.mode.name}")'
 
+    @property
+    def _compressor(self) -> numcodecs.abc.Codec | None:
+        """:class:`numcodecs.abc.Codec`: compressor used for numerical arrays."""
+        return self.default_compressor if self.compression else None
+
+    @staticmethod
+    def _flush_append_buffers(
+        append_buffers: dict[tuple[str, ...], tuple[zarr.Array, list]],
+    ) -> None:
+        """Write all items that have been buffered for dynamic arrays.
+
+        Args:
+            append_buffers (dict):
+                The buffers containing the zarr arrays and the items to append
+        """
+        for arr_obj, items in append_buffers.values():
+            if not items:
+                continue
+            # collect the items in a single array, which is appended in one go
+            if arr_obj.dtype == object:
+                # convert items individually to keep their representation
+                batch = np.concatenate([np.asanyarray([item]) for item in items])
+            else:
+                batch = np.empty((len(items),) + arr_obj.shape[1:], arr_obj.dtype)
+                for i, item in enumerate(items):
+                    batch[i] = item
+            arr_obj.append(batch)
+            items.clear()
+
+    @_apply_blosc_threads
+    def flush(self) -> None:
+        """Write (cached) data to storage."""
+        self._flush_append_buffers(self._append_buffers)
+        self._append_buffers.clear()
+
+    def _flush_location(self, loc: Sequence[str]) -> None:
+        """Write buffered items of dynamic arrays at or below a location.
+
+        This needs to happen before the location is rewritten, since the buffers
+        refer to the arrays that are currently stored there.
+
+        Args:
+            loc (list of str):
+                The location in the storage that will be rewritten
+        """
+        key = tuple(loc)
+        if any(buf_key[: len(key)] == key for buf_key in self._append_buffers):
+            self.flush()
+
     def close(self) -> None:
+        self.flush()
         if self._close:
             self._store.close()
         self._root = None
@@ -134,6 +275,18 @@ class ZarrStorage(StorageBase):
         else:
             return self._root.keys()  # type: ignore
 
+    def __contains__(self, loc: Sequence[str]):
+        if not loc:
+            return True  # the root is always contained in the storage
+        try:
+            parent = self[loc[:-1]]
+        except KeyError:
+            return False
+        if not isinstance(parent, zarr.hierarchy.Group):
+            raise TypeError(f"`/{'/'.join(loc)}` is not a group")
+        # query the store directly instead of scanning all keys of the group
+        return loc[-1] in parent
+
     def is_group(self, loc: Sequence[str], *, ignore_cls: bool = False) -> bool:
         return isinstance(self[loc], zarr.hierarchy.Group)
 
@@ -147,9 +300,15 @@ class ZarrStorage(StorageBase):
     def _write_attr(self, loc: Sequence[str], name: str, value: str) -> None:
         self[loc].attrs[name] = value
 
+    def _write_attrs(self, loc: Sequence[str], attrs: AttrsLike) -> None:
+        # zarr serializes all attributes on each modification, so we update them at once
+        self[loc].attrs.update(attrs)
+
+    @_apply_blosc_threads
     def _read_array(
-        self, loc: Sequence[str], *, copy: bool, index: int | None = None
+        self, loc: Sequence[str], *, copy: bool, index: int | slice | None = None
     ) -> np.ndarray:
+        self.flush()  # make sure all appended items are available
         arr_like = self[loc]
 
         if not isinstance(arr_like, zarr.Array):
@@ -162,13 +321,40 @@ class ZarrStorage(StorageBase):
             arr_like = arr_like[index]
 
         # convert it into the right type
-        arr = np.array(arr_like, copy=copy)
+        arr = np.array(arr_like, copy=True) if copy else np.asarray(arr_like)
         if is_recarray:
             arr = arr.view(np.recarray)
 
         return arr
 
+    @_apply_blosc_threads
+    def _read_array_into(
+        self, loc: Sequence[str], out: np.ndarray, *, index: int | slice | None = None
+    ) -> None:
+        self.flush()  # make sure all appended items are available
+        arr_like = self[loc]
+
+        if (
+            isinstance(arr_like, zarr.Array)
+            and arr_like.dtype == out.dtype != object
+            and not isinstance(index, slice)
+        ):
+            if index is None:
+                selection: Any = Ellipsis
+                shape = arr_like.shape
+            else:
+                selection = index
+                shape = arr_like.shape[1:]
+            if out.shape == shape:
+                # decode the chunks directly into the supplied array
+                arr_like.get_basic_selection(selection, out=out)
+                return
+
+        super()._read_array_into(loc, out, index=index)
+
+    @_apply_blosc_threads
     def _write_array(self, loc: Sequence[str], arr: np.ndarray) -> None:
+        self._flush_location(loc)
         parent, name = self._get_parent(loc)
 
         if name in parent:
@@ -181,7 +367,9 @@ class ZarrStorage(StorageBase):
             if arr.dtype == object:
                 el = parent.array(name, arr, object_codec=self.codec, overwrite=True)
             else:
-                el = parent.array(name, arr, overwrite=True)
+                el = parent.array(
+                    name, arr, compressor=self._compressor, overwrite=True
+                )
 
             if isinstance(arr, np.recarray):
                 el.attrs["__recarray__"] = True
@@ -193,9 +381,11 @@ class ZarrStorage(StorageBase):
         dtype: DTypeLike,
         record_array: bool = False,
     ) -> None:
+        self._flush_location(loc)
         parent, name = self._get_parent(loc)
         try:
             if dtype == object:
+                # the size of the items is unknown, so we store each in its own chunk
                 element = parent.zeros(
                     name,
                     shape=(0,) + shape,
@@ -206,8 +396,19 @@ class ZarrStorage(StorageBase):
                 )
 
             else:
+                if self.can_update:
+                    # collect many items in a chunk, which are written in one go
+                    item_size = np.dtype(dtype).itemsize * int(np.prod(shape))
+                    items = DYNAMIC_CHUNK_SIZE // max(item_size, 1)
+                    items = max(min(items, DYNAMIC_CHUNK_ITEMS), 1)
+                else:
+                    items = 1  # partially filled chunks cannot be rewritten
                 element = parent.zeros(
-                    name, shape=(0,) + shape, chunks=(1,) + shape, dtype=dtype
+                    name,
+                    shape=(0,) + shape,
+                    chunks=(items,) + shape,
+                    dtype=dtype,
+                    compressor=self._compressor,
                 )
         except zarr.errors.ContainsArrayError as err:
             raise RuntimeError(f"Array `/{'/'.join(loc)}` already exists") from err
@@ -215,15 +416,34 @@ class ZarrStorage(StorageBase):
             if record_array:
                 element.attrs["__recarray__"] = True
 
+    @_apply_blosc_threads
     def _extend_dynamic_array(self, loc: Sequence[str], data: ArrayLike) -> None:
-        arr_obj = self[loc]
-        arr_obj.append([data])
-
+        key = tuple(loc)
+        try:
+            arr_obj, items = self._append_buffers[key]
+        except KeyError:
+            arr_obj, items = self._append_buffers[key] = (self[loc], [])
+        items.append(np.array(data, copy=True))  # the caller might modify `data`
+        if len(items) >= arr_obj.chunks[0]:
+            # write buffered items once they fill a complete chunk. All dynamic arrays
+            # are written together, so related arrays (like the data and the time
+            # points of a trajectory) stay in sync on disk
+            self.flush()
+
+    @_apply_blosc_threads
     def _read_object(self, loc: Sequence[str]) -> Any:
         return self[loc][0]
 
+    @_apply_blosc_threads
     def _write_object(self, loc: Sequence[str], obj: Any) -> None:
         arr: np.ndarray = np.empty(1, dtype=object)  # encode object in an array
         arr[0] = obj
+        if type(obj) is bytes:
+            codec = numcodecs.VLenBytes()  # store raw bytes without pickling them
+        elif type(obj) is str:
+            codec = numcodecs.VLenUTF8()  # store text without pickling it
+        else:
+            codec = self.codec
+        self._flush_location(loc)
         parent, name = self._get_parent(loc)
-        parent.array(name, arr, object_codec=self.codec, overwrite=True)
+        parent.array(name, arr, object_codec=codec, overwrite=True)
@@ -85,6 +85,11 @@ class StorageBase(metaclass=ABCMeta):
         # we are using a property instead of an attribute to make this read-only
         return True
 
+    @property
+    def thread_safe(self) -> bool:
+        """bool: indicates whether items can be read from several threads at once"""
+        return False
+
     def flush(self) -> None:
         """Write (cached) data to storage."""
 
@@ -235,12 +240,34 @@ class StorageBase(metaclass=ABCMeta):
         Returns:
             dict: A copy of the attributes at this location
         """
+        return self._decode_user_attrs(self._read_all_attrs(loc))
+
+    def _read_all_attrs(self, loc: Sequence[str]) -> dict[str, Any]:
+        """Read all attributes, including internal ones, at a particular location.
+
+        Args:
+            loc (list of str):
+                The location in the storage where the attributes are read
+
+        Returns:
+            dict: A copy of the raw attributes at this location
+        """
         if not self.mode.read:
             raise AccessError("No right to read attributes")
-        attrs = {
-            k: v for k, v in self._read_attrs(loc).items() if not k.startswith("__")
-        }
-        return decode_attrs(attrs)
+        return dict(self._read_attrs(loc))
+
+    @staticmethod
+    def _decode_user_attrs(attrs: AttrsLike) -> Attrs:
+        """Decode the attributes that were set by the user.
+
+        Args:
+            attrs (dict):
+                Raw attributes as returned by :meth:`_read_all_attrs`
+
+        Returns:
+            dict: The decoded attributes without internal ones
+        """
+        return decode_attrs({k: v for k, v in attrs.items() if not k.startswith("__")})
 
     @abstractmethod
     def _write_attr(self, loc: Sequence[str], name: str, value: str) -> None:
@@ -255,6 +282,21 @@ class StorageBase(metaclass=ABCMeta):
                 Value of the attribute
         """
 
+    def _write_attrs(self, loc: Sequence[str], attrs: AttrsLike) -> None:
+        """Write many attributes to a particular location.
+
+        Backends that can store several attributes at once should overwrite this
+        method to avoid serializing the attributes of the item repeatedly.
+
+        Args:
+            loc (list of str):
+                The location in the storage where the attributes are written
+            attrs (dict):
+                The encoded attributes
+        """
+        for name, value in attrs.items():
+            self._write_attr(loc, name, value)
+
     def write_attrs(self, loc: Sequence[str], attrs: Attrs | None) -> None:
         """Write attributes to a particular location.
 
@@ -271,13 +313,12 @@ class StorageBase(metaclass=ABCMeta):
         if attrs is None or len(attrs) == 0:
             return
 
-        for name, value in attrs.items():
-            if name.startswith("__"):
-                # do not encode internal attributes
-                self._write_attr(loc, name, value)
-            else:
-                # serialize and encode all foreign attributes
-                self._write_attr(loc, name, encode_attr(value))
+        # do not encode internal attributes, but serialize all foreign attributes
+        encoded = {
+            name: value if name.startswith("__") else encode_attr(value)
+            for name, value in attrs.items()
+        }
+        self._write_attrs(loc, encoded)
 
     def _write_item_attrs(
         self,
@@ -337,7 +378,7 @@ class StorageBase(metaclass=ABCMeta):
         loc: Sequence[str],
         *,
         copy: bool,
-        index: int | None = None,
+        index: int | slice | None = None,
     ) -> np.ndarray:
         """Read an array from a particular location.
 
@@ -347,7 +388,7 @@ class StorageBase(metaclass=ABCMeta):
             copy (bool):
                 Determines whether a copy of the data is returned. Set this flag to
                 `False` for better performance in cases where the array is not modified.
-            index (int, optional):
+            index (int or slice, optional):
                 An index denoting the subarray that will be read
 
         Returns:
@@ -356,12 +397,30 @@ class StorageBase(metaclass=ABCMeta):
         """
         raise NotImplementedError(f"Cannot read arrays from {self.__class__.__name__}")
 
+    def _read_array_into(
+        self, loc: Sequence[str], out: np.ndarray, *, index: int | slice | None = None
+    ) -> None:
+        """Read an array from a particular location into an existing array.
+
+        Backends that can decode data directly into `out` should overwrite this method
+        to avoid allocating a temporary array.
+
+        Args:
+            loc (list of str):
+                The location in the storage where the array is read
+            out (array):
+                An array to which the results are written
+            index (int or slice, optional):
+                An index denoting the subarray that will be read
+        """
+        out[:] = self._read_array(loc, index=index, copy=False)
+
     def read_array(
         self,
         loc: Sequence[str],
         *,
         out: np.ndarray | None = None,
-        index: int | None = None,
+        index: int | slice | None = None,
     ) -> np.ndarray:
         """Read an array from a particular location.
 
@@ -370,7 +429,7 @@ class StorageBase(metaclass=ABCMeta):
                 The location in the storage where the array is read
             out (array):
                 An array to which the results are written
-            index (int, optional):
+            index (int or slice, optional):
                 An index denoting the subarray that will be read
 
         Returns:
@@ -381,7 +440,7 @@ class StorageBase(metaclass=ABCMeta):
             raise AccessError("No right to read array")
 
         if out is not None:
-            out[:] = self._read_array(loc, index=index, copy=False)
+            self._read_array_into(loc, out, index=index)
         else:
             out = self._read_array(loc, index=index, copy=True)
         return out
@@ -464,6 +523,12 @@ class StorageBase(metaclass=ABCMeta):
     def extend_dynamic_array(self, loc: Sequence[str], arr: ArrayLike) -> None:
         """Extend a dynamic array previously created.
 
+        Some backends buffer the appended items and only write them once a chunk of
+        one of the dynamic arrays is full, in which case the items of all dynamic
+        arrays are written together. Until then, or until :meth:`flush` or
+        :meth:`close` is called, buffered items are not visible to other readers and
+        they are lost if the process ends abruptly.
+
         Args:
             loc (list of str):
                 The location in the storage where the dynamic array is located
@@ -221,18 +221,20 @@ class StorageGroup:
             The reconstructed python object
         """
         loc_list = self._get_loc(loc)
+        # fetch the raw attributes only once, since backends might access the disk
+        attrs = self._storage._read_all_attrs(loc_list)
         if use_class:
-            cls = self.get_class(loc)
+            cls = decode_class(attrs.get("__class__"))
             if cls is not None:
                 # create object using a registered action
                 read_item = storage_actions.get(cls, "read_item")
                 return read_item(self._storage, loc_list)
 
         # read the item using the generic classes
-        obj_type = self._storage._read_attrs(loc_list).get("__type__")
+        obj_type = attrs.get("__type__")
         if obj_type in {"array", "dynamic_array"}:
             arr = self._storage.read_array(loc_list)
-            return Array(arr, attrs=self._storage.read_attrs(loc_list))
+            return Array(arr, attrs=self._storage._decode_user_attrs(attrs))
         elif obj_type == "object":
             return self._storage.read_object(loc_list)
         else:
@@ -335,7 +337,7 @@ class StorageGroup:
         loc: Location,
         *,
         out: np.ndarray | None = None,
-        index: int | None = None,
+        index: int | slice | None = None,
     ) -> np.ndarray:
         """Read an array from a particular location.
 
@@ -344,7 +346,7 @@ class StorageGroup:
                 The location where the array is created
             out (array, optional):
                 An array to which the results are written
-            index (int, optional):
+            index (int or slice, optional):
                 An index denoting the subarray that will be read
 
         Returns:
@@ -11,10 +11,14 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Iterator, Literal
+from typing import Any, Callable, Iterator, Literal
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from .access_modes import AccessError, ModeType
 from .base import StorageBase
@@ -22,6 +26,75 @@ from .group import StorageGroup
 from .tools import StorageID, open_storage
 from .utils import Location, storage_actions
 
+PREFETCH_ITEMS = 2
+"""int: Number of items that are read in advance when iterating over a trajectory"""
+TRAJECTORY_FORMAT = 2
+"""int: Version of the format in which trajectories are written. Version 2 introduced
+time points that are not stored and items with separately stored fields"""
+BULK_READ_SIZE = 1024**3
+"""int: Maximal size in bytes of array trajectories that are read in one go when
+iterating over them"""
+
+
+def _check_format_version(attrs: dict[str, Any]) -> None:
+    """Check whether a trajectory with the given attributes can be handled.
+
+    Args:
+        attrs (dict):
+            The attributes of the trajectory
+
+    Raises:
+        NotImplementedError: if the trajectory was written in a newer format
+    """
+    version = attrs.get("format_version", 1)
+    if version > TRAJECTORY_FORMAT:
+        raise NotImplementedError(f"Cannot handle trajectory format {version}")
+
+
+def _count_items(group: StorageGroup, loc: Location, num_items: int) -> int:
+    """Count the items of a dynamic array, which might exceed the recorded number.
+
+    The number of items is only recorded when a writer is closed, so the array might
+    contain more items if the trajectory is still written or the writer crashed.
+
+    Args:
+        group (:class:`~modelrunner.storage.group.StorageGroup`):
+            The group containing the dynamic array
+        loc (str or list of str):
+            The location of the dynamic array in the group
+        num_items (int):
+            The number of items recorded in the attributes
+
+    Returns:
+        int: The number of items stored in the array
+    """
+
+    def exists(index: int) -> bool:
+        """Helper function checking whether the item at `index` was stored."""
+        try:
+            group.read_array(loc, index=index)
+        except IndexError:
+            return False
+        return True
+
+    if not exists(num_items):
+        return num_items  # all items have been recorded
+
+    # find an index beyond the stored items by doubling the step size
+    lower, upper, step = num_items + 1, num_items + 1, 1
+    while exists(upper):
+        lower = upper + 1
+        upper += step
+        step *= 2
+    # bisect the interval to find the number of stored items
+    while lower < upper:
+        mid = (lower + upper) // 2
+        if exists(mid):
+            lower = mid + 1
+        else:
+            upper = mid
+    return lower
+
 
 class TrajectoryWriter:
     """Writes trajectories into a storage.
@@ -48,7 +121,7 @@ class TrajectoryWriter:
             assert trajectory[-1] == data1
     """
 
-    _item_type: Literal["array", "object"]
+    _item_type: Literal["array", "object", "struct"]
 
     def __init__(
         self,
@@ -57,6 +130,8 @@ class TrajectoryWriter:
         *,
         attrs: dict[str, Any] | None = None,
         mode: ModeType | None = None,
+        time_dtype: DTypeLike = float,
+        schema: dict[str, tuple[DTypeLike, tuple[int, ...]]] | None = None,
     ):
         """
         Args:
@@ -73,6 +148,15 @@ class TrajectoryWriter:
                 is raised, otherwise the choice corresponds to `mode="full"` and thus
                 creates a new trajectory. If the file exists, use `mode="truncate"` to
                 overwrite file or `mode="append"` to insert new data into the file.
+            time_dtype (numpy dtype):
+                The data type used for storing the time points, e.g., `np.float32` or
+                `np.int64` to save space. Time points are converted to this type. When
+                appending to an existing trajectory, the stored type is used instead.
+            schema (dict, optional):
+                Describes items that are dictionaries with a fixed set of fields. The
+                schema maps the name of each field to a tuple of its dtype and shape.
+                Each field is then stored in a separate array, which is more compact
+                and faster to read than pickling the dictionaries.
         """
         # create the root group where we store all the data
         if mode is None:
@@ -92,19 +176,94 @@ class TrajectoryWriter:
         else:
             raise AccessError("Cannot insert data. Open storage with write access")
 
+        # number of items whose time points are not stored since they simply count the
+        # items (`None` if time points are stored explicitly)
+        self._implicit_times: int | None = 0
+        # whether time points are monotonously increasing (`None` if unknown)
+        self._monotonic: bool | None = True
+        # the last time point, so it does not need to be read from the storage
+        self._last_time: Any = -np.inf
+        self._schema = schema
+        self._fields: list[str] = []
+        self._append_item: Callable[[Any], None]
+
         # make sure we don't overwrite data
-        if "times" in self._trajectory or "data" in self._trajectory:
+        self._initialized = "data" in self._trajectory
+        if self._initialized or "times" in self._trajectory:
             if not self._storage.mode.dynamic_append:
                 raise OSError("Storage already contains data and we cannot append")
-            self._item_type = self._trajectory.attrs["item_type"]
+            traj_attrs = self._trajectory.attrs
+            _check_format_version(traj_attrs)
+            self._fields = traj_attrs.get("fields", [])
+            self._set_item_type(traj_attrs["item_type"])
+            if self._item_type == "array":
+                item = self._trajectory.read_array("data", index=-1)
+                self._data_dtype, self._data_shape = item.dtype, item.shape
+            self._implicit_times = traj_attrs.get("implicit_times")
+            self._monotonic = traj_attrs.get("monotonic")
+            if self._implicit_times is None:
+                self._last_time = self._trajectory.read_array("time", index=-1)
+                time_dtype = self._last_time.dtype
+            else:
+                # a writer that has not been closed did not record all its items
+                self._implicit_times = _count_items(
+                    self._trajectory, ["data"] + self._fields[:1], self._implicit_times
+                )
+                time_dtype = self._trajectory.read_array("time").dtype
+        self._time_dtype = np.dtype(time_dtype)
 
-        if attrs is not None:
-            self._trajectory.write_attrs(attrs=attrs)
+        # attributes of new trajectories are written together with the internal ones to
+        # save store accesses. Existing trajectories are updated right away, so the
+        # attributes are not lost if the writer is not closed
+        self._pending_attrs: dict[str, Any] = {} if attrs is None else dict(attrs)
+        if self._initialized and self._pending_attrs:
+            self._trajectory.write_attrs(None, self._pending_attrs)
+            self._pending_attrs = {}
 
     @property
     def times(self) -> np.ndarray:
         """:class:`~numpy.ndarray`: Time points written so far."""
-        return self._trajectory.read_array("time")
+        times = self._trajectory.read_array("time")
+        if self._implicit_times is None:
+            return times
+        else:
+            return np.arange(self._implicit_times, dtype=times.dtype)
+
+    def _set_item_type(self, item_type: Literal["array", "object", "struct"]) -> None:
+        """Set the type of the items and the matching method for appending them."""
+        self._item_type = item_type
+        if item_type == "array":
+            self._append_item = self._append_array
+        elif item_type == "object":
+            self._append_item = self._append_object
+        elif item_type == "struct":
+            self._append_item = self._append_struct
+        else:
+            raise NotImplementedError(f"Cannot append items of type `{item_type}`")
+
+    def _append_array(self, data: np.ndarray) -> None:
+        """Append an array item to the data."""
+        # convert the data once here, so the storage can use it directly
+        data = np.asarray(data, dtype=self._data_dtype)
+        if data.shape != self._data_shape:
+            raise TypeError(f"Shape mismatch ({self._data_shape} != {data.shape})")
+        self._trajectory.extend_dynamic_array("data", data)
+
+    def _append_object(self, data: Any) -> None:
+        """Append an arbitrary object to the data."""
+        arr: np.ndarray = np.empty((), dtype=object)
+        arr[...] = data
+        self._trajectory.extend_dynamic_array("data", arr)
+
+    def _append_struct(self, data: dict[str, Any]) -> None:
+        """Append the fields of a dictionary to separate arrays."""
+        if data.keys() != set(self._fields):
+            raise ValueError(
+                f"Fields {sorted(data.keys())} of the item do not match the fields "
+                f"{self._fields} of the trajectory"
+            )
+        for name in self._fields:
+            self._trajectory.extend_dynamic_array(["data", name], data[name])
 
     def append(self, data: Any, time: float | None = None) -> None:
         """Append data to the trajectory.
@@ -114,38 +273,77 @@ class TrajectoryWriter:
                 The data to append to the trajectory
             time (float, optional):
                 The associated time point. If omitted, the last time point is
-                incremented by one.
+                incremented by one. If time points are never given, they are not
+                stored, since they can be deduced from the number of items.
         """
-        if "data" not in self._trajectory:
+        if not self._initialized:
             # initialize new trajectory
-            if isinstance(data, np.ndarray):
-                dtype = data.dtype
-                shape: tuple[int, ...] = data.shape
-                self._item_type = "array"
+            traj_attrs, self._pending_attrs = self._pending_attrs, {}
+            if self._schema is not None:
+                # store each field of the items in a separate array
+                self._fields = traj_attrs["fields"] = list(self._schema)
+                self._set_item_type("struct")
+                self._trajectory.create_group("data")
+                for name, (dtype, shape) in self._schema.items():
+                    self._trajectory.create_dynamic_array(
+                        ["data", name], shape=shape, dtype=dtype
+                    )
+            elif isinstance(data, np.ndarray):
+                self._set_item_type("array")
+                self._data_dtype, self._data_shape = data.dtype, data.shape
+                self._trajectory.create_dynamic_array(
+                    "data", shape=data.shape, dtype=data.dtype
+                )
             else:
-                dtype = object
-                shape = ()
-                self._item_type = "object"
-            self._trajectory.create_dynamic_array("data", shape=shape, dtype=dtype)
-            self._trajectory.create_dynamic_array("time", shape=(), dtype=float)
-            self._trajectory.write_attrs(None, {"item_type": self._item_type})
-            if time is None:
-                time = 0.0
-        else:
+                self._set_item_type("object")
+                self._trajectory.create_dynamic_array("data", shape=(), dtype=object)
+            self._trajectory.create_dynamic_array(
+                "time", shape=(), dtype=self._time_dtype
+            )
+            traj_attrs["item_type"] = self._item_type
+            traj_attrs["format_version"] = TRAJECTORY_FORMAT
             if time is None:
-                time = float(self._trajectory.read_array("time", index=-1)) + 1.0
+                # record the implicit time points right away, so readers and writers
+                # do not expect stored time points
+                traj_attrs["implicit_times"] = self._implicit_times
+            else:
+                self._implicit_times = None
+            self._trajectory.write_attrs(None, traj_attrs)
+            self._initialized = True
 
-        if self._item_type == "array":
-            self._trajectory.extend_dynamic_array("data", data)
-        elif self._item_type == "object":
-            arr: np.ndarray = np.empty((), dtype=object)
-            arr[...] = data
-            self._trajectory.extend_dynamic_array("data", arr)
+        self._append_item(data)
+
+        if self._implicit_times is not None:
+            if time is None:
+                self._implicit_times += 1  # time points simply count the items
+                return
+            # store the time points that have been implicit so far
+            for t in range(self._implicit_times):
+                self._trajectory.extend_dynamic_array("time", self._time_dtype.type(t))
+                self._last_time = t
+            self._trajectory.write_attrs(None, {"implicit_times": None})
+            self._implicit_times = None
+        if time is None:
+            value = np.array(self._last_time + 1, dtype=self._time_dtype)
         else:
-            raise NotImplementedError
-        self._trajectory.extend_dynamic_array("time", time)
+            value = np.array(time, dtype=self._time_dtype)
+        if self._monotonic and value < self._last_time:
+            self._monotonic = False
+        self._last_time = value
+        self._trajectory.extend_dynamic_array("time", value)
 
     def close(self):
+        attrs, self._pending_attrs = self._pending_attrs, {}
+        if self._initialized:
+            if self._implicit_times is not None:
+                # record the number of items, so the time points can be reconstructed
+                attrs["implicit_times"] = self._implicit_times
+            if self._monotonic is not None:
+                # record the ordering, so readers do not need to check it
+                attrs["monotonic"] = self._monotonic
+        if attrs:
+            self._trajectory.write_attrs(None, attrs)
+        self._implicit_times = self._monotonic = None
         self._storage.close()
 
     def __enter__(self):
@@ -165,15 +363,26 @@ class Trajectory:
         times (:class:`~numpy.ndarray`): Time points at which data is available
     """
 
-    _item_type: Literal["array", "object"]
+    _item_type: Literal["array", "object", "struct"]
 
-    def __init__(self, storage: StorageGroup, loc: Location = "trajectory"):
+    def __init__(
+        self,
+        storage: StorageGroup,
+        loc: Location = "trajectory",
+        *,
+        validate: bool | None = None,
+    ):
         """
         Args:
             storage (MutableMapping or string):
                 Store or path to directory in file system or name of zip file.
             loc (str or list of str):
                 The location in the storage where the trajectory data is read.
+            validate (bool, optional):
+                Whether to check that the time points are monotonously increasing. If
+                disabled, the time points are only read when they are needed. The
+                default value `None` only checks the time points if the writer did not
+                record that they are monotonous.
         """
         # open the storage
         self._storage = open_storage(storage, mode="read")
@@ -182,19 +391,57 @@ class Trajectory:
 
         # read some intial data from storage
         self.attrs = self._storage.read_attrs(self._loc)
+        _check_format_version(self.attrs)
         self._item_type = self.attrs["item_type"]
-        self.times = self._storage.read_array(self._loc + ["time"])
+        if self._item_type not in {"array", "object", "struct"}:
+            raise NotImplementedError(f"Cannot read items of type `{self._item_type}`")
+
+        # resolve the location and type of the items once, so they can be read quickly
+        self._data_storage = self._storage._storage
+        self._data_loc = self._storage._get_loc(self._loc + ["data"])
+        self._is_array = self._item_type == "array"
+        self._fields: list[str] = self.attrs.get("fields", [])
+        self._read_item: Callable[[int], Any]
+        if self._is_array:
+            self._read_item = self._read_array_item
+        elif self._item_type == "object":
+            self._read_item = self._read_object_item
+        else:
+            self._read_item = self._read_struct_item
 
-        # check temporal ordering
-        if np.any(np.diff(self.times) < 0):
-            raise ValueError(f"Times are not monotonously increasing: {self.times}")
+        if validate is None:
+            validate = not self.attrs.get("monotonic", False)
+        if validate and self.attrs.get("implicit_times") is None:
+            # check temporal ordering without allocating the differences
+            times = self.times
+            if (times[1:] < times[:-1]).any():
+                raise ValueError(f"Times are not monotonously increasing: {times}")
+
+    @cached_property
+    def times(self) -> np.ndarray:
+        """:class:`~numpy.ndarray`: Time points at which data is available."""
+        times = self._storage.read_array(self._loc + ["time"])
+        num_items = self.attrs.get("implicit_times")
+        if num_items is None:
+            return times
+        else:
+            # time points have not been stored since they simply count the items,
+            # which are only recorded when the writer is closed
+            loc = self._loc + ["data"] + self._fields[:1]
+            num_items = _count_items(self._storage, loc, num_items)
+            return np.arange(num_items, dtype=times.dtype)
+
+    @cached_property
+    def _len(self) -> int:
+        """int: Number of items in the trajectory."""
+        return len(self.times)
 
     def close(self) -> None:
         """Close the openend storage."""
         self._storage.close()
 
     def __len__(self) -> int:
-        return len(self.times)
+        return self._len
 
     def _get_item(self, t_index: int) -> Any:
         """Return the data object corresponding to the given time index.
@@ -209,30 +456,151 @@ class Trajectory:
             The requested item
         """
         if t_index < 0:
-            t_index += len(self)
+            t_index += self._len
 
-        if not 0 <= t_index < len(self):
+        if not 0 <= t_index < self._len:
             raise IndexError("Time index out of range")
 
-        res = self._storage.read_array(self._loc + ["data"], index=t_index)
-        if self._item_type == "array":
-            return res
-        elif self._item_type == "object":
-            return res.item()
+        return self._read_item(t_index)
+
+    def _read_array_item(self, t_index: int) -> np.ndarray:
+        """Read the array stored at a valid time index."""
+        return self._data_storage.read_array(self._data_loc, index=t_index)
+
+    def _read_object_item(self, t_index: int) -> Any:
+        """Read the object stored at a valid time index."""
+        return self._data_storage.read_array(self._data_loc, index=t_index)[()]
+
+    def _read_struct_item(self, t_index: int) -> dict[str, Any]:
+        """Read the fields of the dictionary stored at a valid time index."""
+        read_array = self._data_storage.read_array
+        item = {}
+        for name in self._fields:
+            value = read_array(self._data_loc + [name], index=t_index)
+            item[name] = value[()] if value.ndim == 0 else value  # unwrap scalars
+        return item
+
+    def read_range(
+        self,
+        start: int | None = None,
+        stop: int | None = None,
+        step: int | None = None,
+        *,
+        max_workers: int = 1,
+    ) -> list[Any]:
+        """Return the data objects corresponding to a range of time indices.
+
+        The indices are interpreted like the arguments of a :class:`slice`, i.e.,
+        `trajectory.read_range(start, stop, step)` is equivalent to
+        `trajectory[start:stop:step]`. Arrays are read from the storage in one go, so
+        each chunk only needs to be decoded once.
+
+        Args:
+            start (int, optional):
+                The first index of the range
+            stop (int, optional):
+                The index after the last index of the range
+            step (int, optional):
+                The step between successive indices
+            max_workers (int):
+                Number of threads used to read (and decompress) arrays concurrently.
+                The range is then split into this many blocks, which are read in
+                parallel. Storages that cannot be read from several threads at once
+                (e.g., zip files and databases) are always read serially.
+
+        Returns:
+            list: The requested items
+        """
+        indices = range(*slice(start, stop, step).indices(self._len))
+        if self._is_array and len(indices) > 0:
+            # read all items covered by the range in one go
+            i_min, i_max = min(indices[0], indices[-1]), max(indices[0], indices[-1])
+            arr = self._read_block(i_min, i_max + 1, max_workers=max_workers)
+            return [arr[i - i_min, ...] for i in indices]
         else:
-            raise NotImplementedError
+            return [self._read_item(i) for i in indices]
+
+    def _read_block(self, start: int, stop: int, *, max_workers: int = 1) -> np.ndarray:
+        """Read the array items with indices in the range from `start` to `stop`."""
+        if max_workers <= 1 or stop - start < 2 or not self._data_storage.thread_safe:
+            # the storage might not support reading from several threads at once
+            index = slice(start, stop)
+            return self._data_storage.read_array(self._data_loc, index=index)
+
+        # split the range into blocks that are read concurrently
+        bounds = np.linspace(start, stop, min(max_workers, stop - start) + 1)
+        bounds = bounds.astype(int)
+
+        def read_block(i: int) -> np.ndarray:
+            index = slice(bounds[i], bounds[i + 1])
+            return self._data_storage.read_array(self._data_loc, index=index)
 
-    def __getitem__(self, key: int) -> Any:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return np.concatenate(
+                list(executor.map(read_block, range(len(bounds) - 1)))
+            )
+
+    def __getitem__(self, key: int | slice) -> Any:
         """Return field at given index or a list of fields for a slice."""
         if isinstance(key, int):
             return self._get_item(key)
+        elif isinstance(key, slice):
+            return self.read_range(key.start, key.stop, key.step)
         else:
             raise TypeError("Unknown key type")
 
     def __iter__(self) -> Iterator[Any]:
-        """Iterate over all stored fields."""
-        for i in range(len(self)):
-            yield self[i]
+        """Iterate over all stored fields.
+
+        Small trajectories of arrays are read in one go, but each item is returned as a
+        separate copy. Otherwise, the next items are read in a background thread while
+        the current item is processed, which hides the latency of slow (e.g., remote)
+        storages. Items are read in the calling thread if the storage cannot be
+        accessed from several threads at once.
+        """
+        if self._len < 2:
+            # no need to start a thread for reading at most a single item
+            for i in range(self._len):
+                yield self._read_item(i)
+            return
+
+        start = 0  # index of the first item that still needs to be read
+        if self._is_array:
+            # the first item determines how much memory all items occupy
+            item = self._read_item(0)
+            yield item
+            start = 1
+            if item.nbytes * self._len <= BULK_READ_SIZE:
+                # decode all chunks at once instead of reading each item separately
+                arr = self._read_block(start, self._len)
+                for i in range(len(arr)):
+                    # copy the item, so it does not keep the entire block alive
+                    yield arr[i, ...].copy()
+                return
+
+        indices = range(start, self._len)
+        if not self._data_storage.thread_safe:
+            # the consumer might access the storage while the next item is read
+            for i in indices:
+                yield self._read_item(i)
+            return
+
+        read_item = self._read_item  # indices are valid, so skip the checks
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            futures = deque(
+                executor.submit(read_item, i) for i in indices[:PREFETCH_ITEMS]
+            )
+            try:
+                for i in indices[PREFETCH_ITEMS:]:
+                    item = futures.popleft().result()
+                    futures.append(executor.submit(read_item, i))
+                    yield item
+                while futures:
+                    yield futures.popleft().result()
+            finally:
+                # do not read further items if the iteration stopped early
+                for future in futures:
+                    future.cancel()
 
 
 storage_actions.register("read_item", Trajectory, Trajectory)
@@ -45,7 +45,9 @@ def encode_binary(obj: Any, *, binary: bool = False) -> str | bytes:
     Returns:
         str or bytes: The encoded object
     """
-    obj_bin = pickle.dumps(obj)
+    # protocol 5 lets numpy arrays pass their buffers without intermediate copies and
+    # can be read by all supported Python versions (3.8+)
+    obj_bin = pickle.dumps(obj, protocol=5)
     if binary:
         return obj_bin
     else:
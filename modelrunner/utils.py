@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
 
 
@@ -46,14 +47,20 @@ class hybridmethod:
 
     def __get__(self, instance, cls):
         if instance is None or self.finstance is None:
-            # either bound to the class, or no instance method available
+            # either bound to the class, or no instance method available. Note that we
+            # cannot cache the bound method (e.g., in `__set_name__`), since `cls` might
+            # be a subclass of the class that defined the method
             return self.fclass.__get__(cls, None)
         return self.finstance.__get__(instance, cls)
 
 
+@functools.lru_cache(maxsize=1024)
 def import_class(identifier: str):
     """Import a class or module given an identifier.
 
+    Results are cached since the mapping from identifiers to objects does not change
+    while the program runs.
+
     Args:
         identifier (str):
             The identifier can be a module or a class. For instance, calling the
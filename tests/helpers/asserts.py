@@ -6,6 +6,8 @@ from typing import Any, Sequence
 
 import numpy as np
 
+_ATOMIC_TYPES = {bool, int, float, complex, str, bytes, type(None)}
+
 
 def homogeneous_shape(arr: Sequence) -> bool:
     """Test whether sequence items have all the same length."""
@@ -26,7 +28,11 @@ def assert_data_equals(left: Any, right: Any, *, fuzzy: bool = False) -> bool:
     Returns:
         bool: Whether the two objects are equal
     """
-    if isinstance(left, set) or isinstance(right, set):
+    if type(left) is type(right) and type(left) in _ATOMIC_TYPES:
+        # fast path for the most common leaves, which skips the type checks below
+        assert left == right
+
+    elif isinstance(left, set) or isinstance(right, set):
         # One of the operands is a set, while the other is ordered. This needs to be the
         # first check since otherwise there might be an ordered comparison, which can
         # fail undeterministically.
@@ -41,6 +47,11 @@ def assert_data_equals(left: Any, right: Any, *, fuzzy: bool = False) -> bool:
         elif isinstance(left, str):
             assert left == right
 
+        elif isinstance(left, np.ndarray) and left.dtype != object:
+            # compare numerical arrays in one go instead of element by element
+            assert left.shape == right.shape
+            assert np.array_equal(left, right)
+
         elif isinstance(left, dict):
             assert left.keys() == right.keys()
             for key in left:
@@ -219,6 +219,23 @@ def test_hidden_parameter():
     assert t3.get_parameter_default("b") == 3
 
 
+def test_get_parameters_cache():
+    """Test that the cache of `get_parameters` is specific to each class."""
+
+    class TestCache1(Parameterized):
+        parameters_default = [Parameter("a", 1)]
+
+    params = TestCache1.get_parameters()
+    params.clear()  # modifying the returned dictionary does not affect the cache
+    assert list(TestCache1.get_parameters()) == ["a"]
+
+    class TestCache2(TestCache1):
+        parameters_default = [Parameter("b", 2)]
+
+    assert list(TestCache2.get_parameters()) == ["a", "b"]
+    assert list(TestCache1.get_parameters()) == ["a"]
+
+
 def test_convert_default_values(caplog):
     """Test how default values are handled."""
     caplog.set_level(logging.WARNING)
@@ -261,6 +278,13 @@ def test_convert_default_values(caplog):
     assert len(caplog.records) == 0
     assert t5.parameters["a"] is math.nan
 
+    class TestConvert6(Parameterized):
+        parameters_default = [Parameter("a", np.arange(3), list)]
+
+    t6 = TestConvert6()
+    assert len(caplog.records) == 0
+    assert t6.parameters["a"] == [0, 1, 2]
+
 
 def test_parameters_default_full():
     """Test the _parameters_default_full property."""
@@ -2,18 +2,29 @@
 .. codeauthor:: David Zwicker <david.zwicker@ds.mpg.de>
 """
 
+import os
+import subprocess as sp
 from pathlib import Path
 
 import numpy as np
 import pytest
 
 from modelrunner import Result, ResultCollection
-from modelrunner.run.job import submit_job, submit_jobs
+from modelrunner.run import job
+from modelrunner.run.job import get_job_name, submit_job, submit_jobs
 
 SCRIPT_PATH = Path(__file__).parent / "scripts"
 assert SCRIPT_PATH.is_dir()
 
 
+def test_get_job_name():
+    """Test the get_job_name function."""
+    assert get_job_name("job") == "job"
+    assert get_job_name("job_", {"a": 1}) == "job_A_1"
+    assert get_job_name("job", {"long_name": 0.5}, length=4) == "job_LONG_0.5"
+    assert get_job_name("job", {"a": [1, 2], "b": "x"}) == "job_A_1_2_B_x"
+
+
 def test_submit_job(tmp_path, capsys):
     """Test some basic usage of the submit_job function."""
 
@@ -73,6 +84,28 @@ def test_submit_job_no_output():
     assert outs == "3.0\n"
 
 
+def test_submit_job_existing_output(tmp_path):
+    """Test the submit_job function when the output already exists."""
+    output = tmp_path / "output.json"
+    output.write_text("")
+    with pytest.raises(RuntimeError):
+        submit_job(SCRIPT_PATH / "print.py", output, method="foreground")
+    outs, errs = submit_job(
+        SCRIPT_PATH / "print.py",
+        output,
+        method="foreground",
+        overwrite_strategy="silent_skip",
+    )
+    assert outs == ""
+    assert "already exists" in errs
+    assert output.read_text() == ""
+
+    # output pointing to a folder
+    outs, errs = submit_job(SCRIPT_PATH / "print.py", tmp_path, method="foreground")
+    assert errs == ""
+    assert outs == "3.0\n"
+
+
 def test_submit_jobs(tmp_path):
     """Test some edge cases of the submit_jobs function."""
 
@@ -118,6 +151,124 @@ def test_submit_jobs(tmp_path):
     np.testing.assert_allclose(res["b"][0], [1, 2])
 
 
+def test_submit_jobs_concurrently(tmp_path):
+    """Test submitting multiple jobs concurrently."""
+    num_jobs = submit_jobs(
+        SCRIPT_PATH / "function.py",
+        tmp_path,
+        parameters={"a": [1, 2, 3]},
+        log_folder=tmp_path,
+        method="foreground",
+        max_workers=2,
+    )
+    assert num_jobs == 3
+    col = ResultCollection.from_folder(tmp_path, pattern="*.hdf")
+    np.testing.assert_allclose(np.sort(col.as_dataframe()["a"]), [1, 2, 3])
+
+
+def test_submit_jobs_parameters(tmp_path, monkeypatch):
+    """Test that each job receives its own parameters."""
+    parameters = []
+    monkeypatch.setattr(job, "_submit_script", lambda s, m: ("", ""))
+    monkeypatch.setattr(
+        job, "_render_script", lambda t, args: parameters.append(args["PARAMETERS"])
+    )
+
+    params = {"a": [1, 2], "b": 3}
+    submit_jobs(
+        SCRIPT_PATH / "function.py",
+        tmp_path,
+        parameters=params,
+        method="foreground",
+        template=SCRIPT_PATH / "custom.jinja",
+    )
+    assert parameters == [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+    assert params == {"a": [1, 2], "b": 3}
+
+
+def test_submit_jobs_array(tmp_path, monkeypatch):
+    """Test submitting multiple jobs as an array job."""
+    scripts = []
+    monkeypatch.setattr(job, "_submit_script", lambda s, m: scripts.append(s))
+
+    num_jobs = submit_jobs(
+        SCRIPT_PATH / "function.py",
+        tmp_path,
+        parameters={"a": [1, 2, 3], "b": [4, 5]},
+        list_params=["b"],
+        method="qsub",
+        array=True,
+    )
+    assert num_jobs == 3
+    assert len(scripts) == 1
+    assert "#$ -t 1-3" in scripts[0]
+
+    # run the individual tasks of the array job locally
+    for task_id in range(1, 4):
+        env = dict(os.environ, SGE_TASK_ID=str(task_id))
+        sp.run(["bash"], input=scripts[0], text=True, env=env, check=True)
+    col = ResultCollection.from_folder(tmp_path, pattern="*.hdf").as_dataframe()
+    np.testing.assert_allclose(np.sort(col["a"]), [1, 2, 3])
+    for b in col["b"]:
+        np.testing.assert_allclose(b, [4, 5])
+
+
+@pytest.mark.parametrize("method", ["foreground", "background", "qsub", "srun"])
+def test_submit_jobs_skeleton(method, tmp_path):
+    """Test that the skeleton of the default templates renders correctly."""
+    assert job._supports_skeleton(job._get_template_path(method))
+    script_template = job._get_template(method)
+    skeleton = None
+    for a in [1, 2]:
+        script_args = job._get_script_args(
+            job.escape_string("script.py"),
+            tmp_path / f"job_{a}.hdf",
+            f"job_{a}",
+            {"a": a, "b": "x y"},
+            job.get_config(),
+            log_folder=tmp_path,
+            use_modelrunner=True,
+            overwrite_handler=job._get_overwrite_handler("error"),
+        )
+        if skeleton is None:
+            skeleton = job._render_skeleton(script_template, script_args)
+        expected = job._render_script(script_template, script_args)
+        assert job._fill_skeleton(skeleton, script_args) == expected
+
+
+def test_get_script_args_uninspectable_output(tmp_path):
+    """Test that output paths that cannot be inspected are treated as new files."""
+    output = tmp_path / ("x" * 300) / "job.hdf"  # file name is too long
+    script_args = job._get_script_args(
+        job.escape_string("script.py"),
+        output,
+        "job",
+        {},
+        job.get_config(),
+        log_folder=tmp_path,
+        use_modelrunner=True,
+        overwrite_handler=job._get_overwrite_handler("error"),
+    )
+    assert script_args["OUTPUT_FOLDER"] == str(output.parent)
+
+
+def test_template_supports_skeleton(tmp_path):
+    """Test the detection of templates that can be rendered using a skeleton."""
+    assert not job._supports_skeleton(SCRIPT_PATH / "custom.jinja")
+
+    path = tmp_path / "template.jinja"
+    for content, supported in [
+        ("run {{ JOB_ARGS }} > {{ JOB_NAME }}.txt", True),
+        ("{% if not LOG_FOLDER and JOB_ARGS %}run {{ JOB_ARGS }}{% endif %}", True),
+        ("run > {{ JOB_NAME | upper }}.txt", False),
+        ("{% if JOB_NAME == 'a' %}run{% endif %}", False),
+        ("{{ PARAMETERS.a }}", False),
+    ]:
+        path.write_text(content)
+        os.utime(path, ns=(0, len(content)))  # ensure modification time changes
+        assert job._supports_skeleton(path) == supported, content
+
+
 def test_submit_job_no_modelrunner(tmp_path):
     """Test some basic usage of the submit_job function."""
 
@@ -142,6 +142,20 @@ def test_result_collections_dataframes():
     assert "c" in df.columns
 
 
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_result_collections_from_folder(max_workers, tmp_path):
+    """Test reading result collections from a folder."""
+    for i in range(4):
+        result = Result.from_data({"name": "m", "parameters": {"a": i}}, {"b": 2 * i})
+        result.to_file(tmp_path / f"result_{i}.json")
+    (tmp_path / "broken.json").write_text("{")
+
+    rc = ResultCollection.from_folder(tmp_path, max_workers=max_workers)
+    assert sorted(r.data["b"] for r in rc) == [0, 2, 4, 6]
+    with pytest.raises(Exception, match="broken.json"):
+        ResultCollection.from_folder(tmp_path, strict=True, max_workers=max_workers)
+
+
 def test_collection_groupby():
     """Test grouping of result collections."""
     p1 = {"a": 1, "b": (0, 1), "c": "c"}
@@ -87,6 +87,25 @@ def test_storage_persistence(arr, ext, tmp_path):
         assert not storage.closed
 
 
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_storage_read_array_out(ext, tmp_path):
+    """Test reading arrays into existing arrays."""
+    arr = np.arange(6).reshape(2, 3)
+    with open_storage(tmp_path / f"file{ext}", mode="truncate") as storage:
+        storage.write_array("arr", arr)
+        storage.create_dynamic_array("dyn", arr=arr[0])
+        storage.extend_dynamic_array("dyn", arr[0])
+        storage.extend_dynamic_array("dyn", arr[1])
+
+    with open_storage(tmp_path / f"file{ext}", mode="read") as storage:
+        out = np.empty_like(arr)
+        assert storage.read_array("arr", out=out) is out
+        np.testing.assert_array_equal(out, arr)
+        out = np.empty(3)  # different dtype
+        assert storage.read_array("dyn", index=-1, out=out) is out
+        np.testing.assert_array_equal(out, arr[1])
+
+
 @pytest.mark.parametrize("ext", STORAGE_EXT)
 def test_storage_read(ext, tmp_path):
     """Test read mode."""
@@ -266,6 +285,18 @@ def test_storage_truncate(ext, tmp_path):
         assert_data_equals(storage.read_object("obj"), OBJ)
 
 
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_storage_contains(ext, tmp_path):
+    """Test checking whether items are contained in storages."""
+    with open_storage(tmp_path / f"file{ext}", mode="truncate") as storage:
+        storage.write_array("group/arr", np.arange(3))
+        storage.create_dynamic_array("group/dyn", shape=(), dtype=float)
+        for loc in ["group", "group/arr", "group/dyn"]:
+            assert loc in storage
+        for loc in ["arr", "group/b", "missing"]:
+            assert loc not in storage
+
+
 @pytest.mark.parametrize("ext", STORAGE_EXT)
 def test_appending_to_fixed_array(ext, tmp_path):
     """Test appending an array to a non-dynamic array."""
@@ -302,6 +333,19 @@ def test_storage_copy_array(ext, tmp_path):
         assert not np.array_equal(storage["obj"], obj)
 
 
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_storage_copy_dynamic_array(ext, tmp_path):
+    """Test whether items appended to dynamic arrays are copied."""
+    obj = np.zeros(2)
+    with open_storage(tmp_path / f"file{ext}", mode="truncate") as storage:
+        storage.create_dynamic_array("dyn", arr=obj)
+        for i in range(3):
+            obj[:] = i
+            storage.extend_dynamic_array("dyn", obj)
+    with open_storage(tmp_path / f"file{ext}", mode="read") as storage:
+        np.testing.assert_array_equal(storage["dyn"], [[0, 0], [1, 1], [2, 2]])
+
+
 @pytest.mark.parametrize("ext", STORAGE_EXT)
 def test_storage_copy_dict(ext, tmp_path):
     """Test whether storages make a copy, i.e., that not only a view is stored."""
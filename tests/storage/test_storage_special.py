@@ -3,6 +3,7 @@
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -22,6 +23,11 @@ def test_memory_storage(obj):
         storage.extend_dynamic_array("dyn", np.ones(2))
         np.testing.assert_array_equal(storage.read_array("dyn", index=0), np.ones(2))
 
+        arr = np.arange(3)
+        storage.write_object("obj", arr)
+        arr[0] = 5  # stored objects must not be affected by later modifications
+        np.testing.assert_array_equal(storage.read_object("obj"), np.arange(3))
+
 
 @pytest.mark.skipif(not module_available("h5py"), reason="requires `h5py` module")
 def test_hdf_storage(tmp_path):
@@ -39,6 +45,104 @@ def test_hdf_storage(tmp_path):
         assert root.attrs["test"] == 5
 
 
+@pytest.mark.skipif(not module_available("h5py"), reason="requires `h5py` module")
+@pytest.mark.parametrize("compression", [False, True, "lzf"])
+def test_hdf_storage_compression(compression, tmp_path):
+    """Test compression settings of HDFStorage."""
+    import h5py
+
+    path = tmp_path / "storage.hdf"
+    with open_storage(path, mode="insert", compression=compression) as storage:
+        storage["arr"] = np.arange(5)
+        storage["scalar"] = np.array(5)
+
+    with h5py.File(path, "r") as root:
+        if compression:
+            assert root["arr"].compression == ("gzip" if compression is True else "lzf")
+            assert root["arr"].chunks == (5,)
+        else:
+            assert root["arr"].compression is None
+
+    with open_storage(path, mode="read") as storage:
+        np.testing.assert_array_equal(storage["arr"], np.arange(5))
+        assert storage["scalar"] == 5
+
+
+@pytest.mark.skipif(not module_available("h5py"), reason="requires `h5py` module")
+def test_hdf_storage_chunk_cache(tmp_path):
+    """Test setting the chunk cache of HDFStorage."""
+    with open_storage(tmp_path / "storage.hdf", mode="insert") as storage:
+        cache = storage._storage._file.id.get_access_plist().get_cache()
+        assert cache[1:3] == (100_003, 64 * 1024**2)
+
+    with open_storage(tmp_path / "storage.hdf", mode="read", rdcc_nbytes=2**20) as s:
+        assert s._storage._file.id.get_access_plist().get_cache()[2] == 2**20
+
+
+@pytest.mark.skipif(not module_available("h5py"), reason="requires `h5py` module")
+def test_hdf_storage_dynamic_array(tmp_path):
+    """Test that HDFStorage writes buffered items of dynamic arrays."""
+    import h5py
+
+    from modelrunner.storage.backend.hdf import DYNAMIC_CHUNK_ITEMS
+
+    with open_storage(tmp_path / "storage.hdf", mode="insert") as storage:
+        storage.create_dynamic_array("dyn", shape=(2,), dtype=float)
+        storage.create_dynamic_array("obj", shape=(), dtype=object)
+        for i in range(1000):
+            storage.extend_dynamic_array("dyn", [i, -i])
+            storage.extend_dynamic_array("obj", np.array({"i": i}))
+        np.testing.assert_array_equal(storage.read_array("dyn", index=-1), [999, -999])
+        storage.extend_dynamic_array("dyn", [-1, 1])
+
+    with h5py.File(tmp_path / "storage.hdf", "r") as root:
+        assert root["dyn"].chunks == (DYNAMIC_CHUNK_ITEMS, 2)
+        assert root["dyn"].shape == (1001, 2)
+        assert root["obj"].shape == (1000,)
+
+    with open_storage(tmp_path / "storage.hdf", mode="read") as storage:
+        np.testing.assert_array_equal(storage.read_array("dyn", index=-1), [-1, 1])
+        assert storage.read_array("obj", index=5).item() == {"i": 5}
+
+
+@pytest.mark.skipif(not module_available("h5py"), reason="requires `h5py` module")
+def test_hdf_storage_dynamic_array_unclosed(tmp_path):
+    """Test that HDFStorage writes buffered items if the storage is not closed."""
+    import gc
+
+    import h5py
+
+    from modelrunner.storage.backend.hdf import HDFStorage
+
+    storage = HDFStorage(tmp_path / "storage.hdf", mode="insert")
+    storage.create_dynamic_array(["dyn"], shape=(), dtype=float)
+    storage.create_dynamic_array(["empty"], shape=(2,), dtype=float)
+    for i in range(10):
+        storage.extend_dynamic_array(["dyn"], i)
+    del storage  # the storage is not closed
+    gc.collect()
+
+    with h5py.File(tmp_path / "storage.hdf", "r") as root:
+        np.testing.assert_array_equal(root["dyn"], np.arange(10))
+        assert root["empty"].shape == (0, 2)
+
+
+@pytest.mark.skipif(not module_available("h5py"), reason="requires `h5py` module")
+def test_hdf_storage_dynamic_arrays_in_sync(tmp_path, monkeypatch):
+    """Test that buffered items of different dynamic arrays are written together."""
+    from modelrunner.storage.backend import hdf
+
+    monkeypatch.setattr(hdf, "SINGLE_CHUNK_SIZE", 32)  # data: 2, time: 4 items
+    with open_storage(tmp_path / "storage.hdf", mode="insert") as storage:
+        storage.create_dynamic_array("data", shape=(2,), dtype=float)
+        storage.create_dynamic_array("time", shape=(), dtype=float)
+        for i in range(7):
+            storage.extend_dynamic_array("data", [i, i])
+            storage.extend_dynamic_array("time", i)
+            sizes = storage._storage._dynamic_array_size
+            assert 0 <= sizes["/data"] - sizes["/time"] <= 1
+
+
 @pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
 def test_zarr_storage(tmp_path):
     """Test ZarrStorage."""
@@ -55,6 +159,130 @@ def test_zarr_storage(tmp_path):
         assert root.attrs["test"] == 5
 
 
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+@pytest.mark.parametrize("compression", [True, False])
+def test_zarr_storage_compressor(compression, tmp_path):
+    """Test the compressor used by ZarrStorage."""
+    import zarr
+
+    path = tmp_path / "storage.zarr"
+    with open_storage(path, mode="insert", compression=compression) as storage:
+        storage["arr"] = np.linspace(0, 1, 5)
+        storage.create_dynamic_array("dyn", shape=(2,), dtype=float)
+        storage.extend_dynamic_array("dyn", [1, 2])
+
+    root = zarr.open(path, "r")
+    for name in ["arr", "dyn"]:
+        if compression:
+            assert root[name].compressor.cname == "zstd"
+            assert root[name].compressor.shuffle == zarr.Blosc.BITSHUFFLE
+        else:
+            assert root[name].compressor is None
+
+    with open_storage(path, mode="read") as storage:
+        np.testing.assert_array_equal(storage["dyn"], [[1, 2]])
+
+
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+def test_zarr_storage_blosc_threads(tmp_path, monkeypatch):
+    """Test that the Blosc threading choice only applies to the storage."""
+    import numcodecs
+
+    monkeypatch.setattr(numcodecs.blosc, "use_threads", None)
+    path = tmp_path / "storage.zarr"
+    with open_storage(path, mode="insert", blosc_threads=False) as storage:
+        storage["arr"] = np.linspace(0, 1, 5)
+        np.testing.assert_allclose(storage["arr"], np.linspace(0, 1, 5))
+        assert not storage._storage.thread_safe
+    assert numcodecs.blosc.use_threads is None
+
+    # reading from several threads does not change the global setting
+    storage = open_storage(path, mode="read", blosc_threads=False)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for arr in executor.map(lambda _: storage["arr"], range(64)):
+            np.testing.assert_allclose(arr, np.linspace(0, 1, 5))
+    storage.close()
+    assert numcodecs.blosc.use_threads is None
+
+
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+def test_zarr_storage_dynamic_chunks(tmp_path):
+    """Test that ZarrStorage collects many items in chunks of dynamic arrays."""
+    import zarr
+
+    from modelrunner.storage.backend.zarr import DYNAMIC_CHUNK_ITEMS
+
+    with open_storage(tmp_path / "storage.zarr", mode="insert") as storage:
+        storage.create_dynamic_array("dyn", shape=(2,), dtype=float)
+        for i in range(DYNAMIC_CHUNK_ITEMS + 3):
+            storage.extend_dynamic_array("dyn", [i, -i])
+        assert storage.read_array("dyn", index=-1)[0] == DYNAMIC_CHUNK_ITEMS + 2
+        storage.extend_dynamic_array("dyn", [-1, 1])
+
+    root = zarr.open(tmp_path / "storage.zarr", "r")
+    assert root["dyn"].chunks == (DYNAMIC_CHUNK_ITEMS, 2)
+    assert root["dyn"].shape == (DYNAMIC_CHUNK_ITEMS + 4, 2)
+    np.testing.assert_array_equal(root["dyn"][:3, 0], [0, 1, 2])
+    np.testing.assert_array_equal(root["dyn"][-1], [-1, 1])
+
+
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+def test_zarr_storage_dynamic_arrays_in_sync(tmp_path, monkeypatch):
+    """Test that buffered items of different dynamic arrays are written together."""
+    from modelrunner.storage.backend import zarr
+
+    monkeypatch.setattr(zarr, "DYNAMIC_CHUNK_SIZE", 32)  # data: 2, time: 4 items
+    path = tmp_path / "storage.zarr"
+    with open_storage(path, mode="insert") as storage:
+        storage.create_dynamic_array("data", shape=(2,), dtype=float)
+        storage.create_dynamic_array("time", shape=(), dtype=float)
+        for i in range(7):
+            storage.extend_dynamic_array("data", [i, i])
+            storage.extend_dynamic_array("time", i)
+            with open_storage(path, mode="read") as reader:
+                len_data, len_time = len(reader["data"]), len(reader["time"])
+            assert 0 <= len_data - len_time <= 1
+            assert len_data >= i
+
+
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+def test_zarr_storage_dynamic_array_rewritten(tmp_path):
+    """Test that buffered items do not affect rewritten dynamic arrays."""
+    path = tmp_path / "storage.zarr"
+    with open_storage(path, mode="full") as storage:
+        storage.create_dynamic_array("obj", shape=(2,), dtype=float)
+        storage.extend_dynamic_array("obj", [1, 2])
+        storage.write_object("obj", "text")
+        storage.create_dynamic_array("arr", shape=(2,), dtype=float)
+        storage.extend_dynamic_array("arr", [1, 2])
+        storage.write_array("arr", np.array([[3.0, 4.0]]))
+
+    with open_storage(path, mode="read") as storage:
+        assert storage.read_object("obj") == "text"
+        np.testing.assert_array_equal(storage.read_array("arr"), [[3, 4]])
+
+
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+def test_zarr_storage_text_objects(tmp_path):
+    """Test that ZarrStorage stores bytes and strings without pickling them."""
+    import zarr
+
+    with open_storage(tmp_path / "storage.zarr", mode="insert") as storage:
+        storage.write_object("bytes", b"\x00data")
+        storage.write_object("str", "text \u2713")
+        storage.write_object("list", ["text"])
+
+    root = zarr.open(tmp_path / "storage.zarr", "r")
+    assert root["bytes"].filters[0].codec_id == "vlen-bytes"
+    assert root["str"].filters[0].codec_id == "vlen-utf8"
+    assert root["list"].filters[0].codec_id == "pickle"
+
+    with open_storage(tmp_path / "storage.zarr", mode="read") as storage:
+        assert storage.read_object("bytes") == b"\x00data"
+        assert storage.read_object("str") == "text \u2713"
+        assert storage.read_object("list") == ["text"]
+
+
 def test_json_storage(tmp_path):
     """Test JSONStorage."""
     with open_storage(tmp_path / "test.json", mode="truncate") as storage:
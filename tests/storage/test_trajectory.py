@@ -7,8 +7,14 @@ import shutil
 import numpy as np
 import pytest
 
-from helpers import assert_data_equals, storage_extensions
-from modelrunner.storage import Trajectory, TrajectoryWriter, open_storage
+from helpers import assert_data_equals, module_available, storage_extensions
+from modelrunner.storage import (
+    MemoryStorage,
+    Trajectory,
+    TrajectoryWriter,
+    open_storage,
+    trajectory,
+)
 
 STORAGE_EXT = storage_extensions(incl_folder=True, dot=True, exclude=[".yaml", ".json"])
 STORAGE_OBJECTS = [
@@ -218,3 +224,262 @@ def test_trajectory_reading_while_writing(ext, tmp_path):
         np.testing.assert_allclose(writer.times, [1, 2])
 
     remove_file_or_folder(path)
+
+
+@pytest.mark.skipif(not module_available("zarr"), reason="requires `zarr` module")
+@pytest.mark.parametrize("compression", [True, False])
+def test_trajectory_memmap(compression, tmp_path):
+    """Test reading trajectories from memory-mapped zarr directories."""
+    path = tmp_path / "file.zarr"
+    storage = open_storage(path, mode="insert", compression=compression)
+    with storage, TrajectoryWriter(storage) as writer:
+        for i in range(3):
+            writer.append(np.full(4, i), i)
+        writer.append(np.full(4, 3))
+
+    with open_storage(path, mode="read", memmap=True) as storage:
+        assert storage._storage._store.__class__.__name__ == "_MemMapDirectoryStore"
+        traj = Trajectory(storage)
+        np.testing.assert_allclose(traj.times, [0, 1, 2, 3])
+        for i, data in enumerate(traj):
+            np.testing.assert_array_equal(data, np.full(4, i))
+
+
+@pytest.mark.parametrize("item", [np.arange(3), np.array(1.5), {"a": 1}])
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_trajectory_slices(item, ext, tmp_path):
+    """Test reading slices of trajectories."""
+    path = tmp_path / ("file" + ext)
+    with TrajectoryWriter(path) as writer:
+        for _ in range(5):
+            writer.append(item)
+
+    traj = Trajectory(path)
+    for key in [slice(None), slice(1, 3), slice(None, None, 2), slice(None, None, -1)]:
+        items = traj[key]
+        assert len(items) == len(range(5)[key])
+        for obj in items:
+            assert_data_equals(obj, item)
+            assert obj.__class__ is traj[0].__class__
+    assert traj[4:2] == []
+    assert len(traj.read_range(1, 4)) == 3
+    assert len(traj.read_range(step=-2)) == 3
+    traj.close()
+
+
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+@pytest.mark.parametrize("bulk_read_size", [0, 1024])
+def test_trajectory_iteration(ext, bulk_read_size, tmp_path, monkeypatch):
+    """Test iterating over trajectories, which reads items in bulk or in advance."""
+    monkeypatch.setattr(trajectory, "BULK_READ_SIZE", bulk_read_size)
+    path = tmp_path / ("file" + ext)
+    with TrajectoryWriter(path) as writer:
+        for i in range(7):
+            writer.append(np.full(3, i))
+
+    traj = Trajectory(path)
+    items = list(traj)
+    assert [arr[0] for arr in items] == list(range(7))
+    assert not any(np.shares_memory(a, b) for a, b in zip(items[:-1], items[1:]))
+    for i, arr in enumerate(traj):
+        np.testing.assert_array_equal(arr, np.full(3, i))
+        if i == 2:
+            break  # stop iteration early
+    assert [arr[0] for arr in traj] == list(range(7))
+    assert [arr[0] for arr in traj.read_range(5, 1, -2)] == [5, 3]
+    assert [arr[0] for arr in traj[1::3]] == [1, 4]
+    items = traj.read_range(1, 6, max_workers=3)
+    assert [arr[0] for arr in items] == [1, 2, 3, 4, 5]
+    traj.close()
+
+
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_trajectory_threads(ext, tmp_path, monkeypatch):
+    """Test that only thread-safe storages are read concurrently."""
+    path = tmp_path / ("file" + ext)
+    with TrajectoryWriter(path) as writer:
+        for i in range(7):
+            writer.append(np.full(3, i))
+
+    num_threads = []
+
+    class ThreadPoolExecutor(trajectory.ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            num_threads.append(max_workers)
+            super().__init__(max_workers)
+
+    monkeypatch.setattr(trajectory, "ThreadPoolExecutor", ThreadPoolExecutor)
+    traj = Trajectory(path)
+    items = traj.read_range(1, 6, max_workers=3)
+    assert [arr[0] for arr in items] == [1, 2, 3, 4, 5]
+    thread_safe = ext not in {".zip", ".sqldb"}
+    assert traj._data_storage.thread_safe == thread_safe
+    assert num_threads == ([3] if thread_safe else [])
+
+    # items are only read in advance if the storage is thread-safe
+    num_threads.clear()
+    monkeypatch.setattr(trajectory, "BULK_READ_SIZE", 0)
+    assert [arr[0] for arr in traj] == list(range(7))
+    assert num_threads == ([1] if thread_safe else [])
+    traj.close()
+
+
+def test_trajectory_validate(tmp_path):
+    """Test checking the temporal ordering of trajectories."""
+    path = tmp_path / "file.zarr"
+    with TrajectoryWriter(path) as writer:
+        writer.append(np.arange(3), 2)
+        writer.append(np.arange(3), 1)
+
+    with pytest.raises(ValueError):
+        Trajectory(path)
+    with pytest.raises(ValueError):
+        Trajectory(path, validate=True)
+
+    traj = Trajectory(path, validate=False)
+    np.testing.assert_allclose(traj.times, [2, 1])
+    assert len(traj) == 2
+    traj.close()
+
+    # the writer records whether the time points are ordered
+    with TrajectoryWriter(path, mode="truncate") as writer:
+        writer.append(np.arange(3), 1)
+        writer.append(np.arange(3), 2)
+    traj = Trajectory(path)
+    assert traj.attrs["monotonic"]
+    traj.close()
+
+
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+@pytest.mark.parametrize("time_dtype", [np.float32, np.int64])
+def test_trajectory_time_dtype(ext, time_dtype, tmp_path):
+    """Test storing time points with a different data type."""
+    path = tmp_path / ("file" + ext)
+    with TrajectoryWriter(path, time_dtype=time_dtype) as writer:
+        writer.append(np.arange(3))
+        writer.append(np.arange(3), 2)
+    with TrajectoryWriter(path, mode="append") as writer:
+        writer.append(np.arange(3))
+
+    traj = Trajectory(path)
+    assert traj.times.dtype == time_dtype
+    np.testing.assert_allclose(traj.times, [0, 2, 3])
+    traj.close()
+
+
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_trajectory_implicit_times(ext, tmp_path):
+    """Test trajectories whose time points are not stored explicitly."""
+    path = tmp_path / ("file" + ext)
+    with TrajectoryWriter(path, time_dtype=np.int64) as writer:
+        writer.append(np.arange(3))
+        writer.append(np.arange(3))
+        np.testing.assert_allclose(writer.times, [0, 1])
+
+    traj = Trajectory(path)
+    assert traj.attrs["implicit_times"] == 2
+    assert traj.times.dtype == np.int64
+    np.testing.assert_allclose(traj.times, [0, 1])
+    traj.close()
+
+    # continue with implicit times and then switch to explicit ones
+    with TrajectoryWriter(path, mode="append") as writer:
+        writer.append(np.arange(3))
+        writer.append(np.arange(3), 5)
+        writer.append(np.arange(3))
+
+    traj = Trajectory(path)
+    assert traj.attrs.get("implicit_times") is None
+    np.testing.assert_allclose(traj.times, [0, 1, 2, 5, 6])
+    assert len(traj) == 5
+    traj.close()
+
+
+def test_trajectory_unclosed_writer(tmp_path):
+    """Test reading and appending to trajectories whose writer was not closed."""
+    # explicit time points are not replaced while the trajectory is written
+    storage = MemoryStorage()
+    writer = TrajectoryWriter(storage)
+    writer.append(np.arange(3), 0)
+    writer.append(np.arange(3), 0.5)
+    traj = Trajectory(storage)
+    np.testing.assert_allclose(traj.times, [0, 0.5])
+
+    # implicit time points are deduced from the items written so far
+    storage = MemoryStorage()
+    writer = TrajectoryWriter(storage)
+    for i in range(5):
+        writer.append(np.full(3, i))
+    traj = Trajectory(storage)
+    assert len(traj) == 5
+    np.testing.assert_allclose(traj.times, np.arange(5))
+    np.testing.assert_allclose(traj[-1], np.full(3, 4))
+
+    # implicit time points continue after all stored items
+    path = tmp_path / "file.zarr"
+    storage = open_storage(path, mode="full")
+    writer = TrajectoryWriter(storage)
+    writer.append(np.arange(3))
+    writer.append(np.arange(3))
+    storage.close()  # the writer is not closed, so it does not record the items
+    assert len(Trajectory(path)) == 2
+    with TrajectoryWriter(path, mode="append") as writer:
+        writer.append(np.arange(3))
+    traj = Trajectory(path)
+    np.testing.assert_allclose(traj.times, [0, 1, 2])
+    assert len(traj) == 3
+
+    # attributes of existing trajectories are written right away
+    writer = TrajectoryWriter(path, mode="append", attrs={"test": "yes"})
+    assert Trajectory(path).attrs["test"] == "yes"
+    writer.close()
+
+
+@pytest.mark.parametrize("ext", STORAGE_EXT)
+def test_trajectory_schema(ext, tmp_path):
+    """Test storing dictionaries with fixed fields in separate arrays."""
+    path = tmp_path / ("file" + ext)
+    schema = {"a": (float, ()), "b": (int, (2,))}
+    with TrajectoryWriter(path, schema=schema) as writer:
+        writer.append({"a": 1.5, "b": np.array([1, 2])})
+    with TrajectoryWriter(path, mode="append") as writer:
+        writer.append({"a": 2.5, "b": np.array([3, 4])}, 3)
+        with pytest.raises(ValueError):
+            writer.append({"a": 3.5})  # missing field
+        with pytest.raises(ValueError):
+            writer.append({"a": 3.5, "b": np.array([5, 6]), "c": 1})  # extra field
+
+    traj = Trajectory(path)
+    assert traj.attrs["item_type"] == "struct"
+    assert len(traj) == 2
+    np.testing.assert_allclose(traj.times, [0, 3])
+    for item, a, b in zip(traj, [1.5, 2.5], [[1, 2], [3, 4]]):
+        assert item.keys() == {"a", "b"}
+        assert np.isscalar(item["a"])
+        assert item["a"] == a
+        np.testing.assert_equal(item["b"], b)
+    assert traj[-1]["a"] == 2.5
+    traj.close()
+
+
+def test_trajectory_array_conversion():
+    """Test that array items are converted to the stored type."""
+    storage = MemoryStorage()
+    with TrajectoryWriter(storage) as writer:
+        writer.append(np.zeros(3))
+        writer.append(np.arange(3))  # integers are converted to floats
+        writer.append(np.zeros(6)[::2])  # views are accepted
+        with pytest.raises(TypeError):
+            writer.append(np.zeros(4))
+
+    traj = Trajectory(storage)
+    np.testing.assert_array_equal(traj[1], [0.0, 1.0, 2.0])
+    assert traj[1].dtype == float
+    assert len(traj) == 3
+
+
+def test_trajectory_attrs_without_items():
+    """Test that attributes are written even if no items are appended."""
+    storage = MemoryStorage()
+    TrajectoryWriter(storage, attrs={"test": "yes"}).close()
+    assert storage.read_attrs(["trajectory"])["test"] == "yes"